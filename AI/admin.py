@@ -9,6 +9,9 @@ class JobProcessedDataAdmin(admin.ModelAdmin):
     search_fields = ("job__title",)
     readonly_fields = ("id", "created_at", "updated_at")
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related("job")
+
 
 @admin.register(CVProcessedData)
 class CVProcessedDataAdmin(admin.ModelAdmin):
@@ -34,3 +37,12 @@ class JobCVMatchAdmin(admin.ModelAdmin):
     list_filter = ("job",)
     readonly_fields = ("id", "created_at", "updated_at")
     ordering = ("-match_score",)
+
+    def get_queryset(self, request):
+        return (
+            super()
+            .get_queryset(request)
+            .select_related(
+                "job", "application__job", "application__applicant__user"
+            )
+        )
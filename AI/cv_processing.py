@@ -1,159 +1,259 @@
 import os
 import re
-import json
 import logging
 import numpy as np
 import fitz
 import docx2txt
 import spacy
-import tempfile
+import io
+import hashlib
 import traceback
-from sentence_transformers import SentenceTransformer
+from functools import lru_cache
 from django.conf import settings
 from .models import CVProcessedData
+from .model_loader import get_sentence_transformer, model_signature
+from .text_utils import (
+    advanced_preprocessing,
+    clean_text,
+    get_skill_matcher,
+    load_it_skills,
+)
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
-# Directory for processed CV data
-CV_DATA_DIR = os.path.join(settings.BASE_DIR, "AI", "cv_processed_data")
-os.makedirs(CV_DATA_DIR, exist_ok=True)
 
-# Load spaCy language model
-try:
-    nlp = spacy.load("en_core_web_sm")
-except OSError:
-    logger.warning("Installing en_core_web_sm model...")
-    os.system("python -m spacy download en_core_web_sm")
-    nlp = spacy.load("en_core_web_sm")
+@lru_cache(maxsize=1)
+def get_nlp():
+    # spaCy pipeline used only for sentence segmentation: the rule-based
+    # sentencizer is much cheaper than parser/senter based boundary detection.
+    # Built on first use so importing this module stays cheap
+    nlp = spacy.blank("en")
+    nlp.add_pipe("sentencizer")
+    return nlp
+
+
+# Sections formatted without sentence segmentation (see enhance_cv_section)
+NON_SENTENCE_SECTIONS = ("skills", "experience", "education")
+
+# Sections saved on CVProcessedData; anything else found in a CV (languages,
+# unrecognized text) is never used, so it is not enhanced or embedded
+SAVED_SECTIONS = (
+    "summary",
+    "experience",
+    "education",
+    "skills",
+    "projects",
+    "certifications",
+    "achievements",
+)
+
+
+# Bump whenever extraction or embedding output changes, so CVs processed by an
+# older pipeline are not reused through their content hash
+CV_PROCESSING_VERSION = 1
+
+
+# Whitespace runs, collapsed in matched experience phrases
+_WS_RE = re.compile(r"\s+")
+
+
+# Section heading patterns
+SECTION_PATTERNS = {
+    "summary": [
+        "summary",
+        "professional summary",
+        "profile",
+        "about me",
+        "personal statement",
+        "objective",
+        "career objective",
+    ],
+    "experience": [
+        "experience",
+        "work experience",
+        "employment history",
+        "work history",
+        "professional experience",
+        "experiences",
+        "work experiences",
+        "work history",
+        "experience summary",
+        "career history",
+    ],
+    "education": [
+        "education",
+        "academic background",
+        "academic history",
+        "qualifications",
+        "educations",
+        "education summary",
+        "education history",
+        "education background",
+        "education summary",
+        "education history",
+        "education background",
+    ],
+    "skills": [
+        "skills",
+        "technical skills",
+        "core competencies",
+        "key skills",
+        "expertise",
+        "skills summary",
+        "tech stack",
+        "technical expertise",
+    ],
+    "projects": [
+        "projects",
+        "personal projects",
+        "professional projects",
+        "key projects",
+        "projects summary",
+        "project summary",
+        "project experience",
+        "highlighted projects",
+    ],
+    "certifications": [
+        "certifications",
+        "certificates",
+        "professional certifications",
+    ],
+    "languages": [
+        "language",
+        "languages",
+        "language proficiency",
+        "language skills",
+    ],
+    "achievements": [
+        "achievements",
+        "awards",
+        "honors",
+        "accomplishments",
+        "prizes",
+        "awards",
+        "prizes and awards",
+    ],
+}
+
+# Section mapping for normalization
+SECTION_MAPPING = {
+    "summary": "summary",
+    "profile": "summary",
+    "about": "summary",
+    "experience": "experience",
+    "work": "experience",
+    "employment": "experience",
+    "education": "education",
+    "academic": "education",
+    "qualifications": "education",
+    "skills": "skills",
+    "technical": "skills",
+    "competencies": "skills",
+    "expertise": "skills",
+    "projects": "projects",
+    "certifications": "certifications",
+    "certificates": "certifications",
+    "languages": "languages",
+    "achievements": "achievements",
+    "awards": "achievements",
+    "honors": "achievements",
+}
+
+
+# Heading pattern -> section for exact lookups; built in reverse so the first
+# section listing a pattern wins, as in the original scan order
+_PATTERN_TO_SECTION = {
+    pattern: section
+    for section, patterns in reversed(SECTION_PATTERNS.items())
+    for pattern in patterns
+}
+
+# All section headings in one anchored alternation; the named group that
+# matched (tried in section order) gives the section type
+_HEADING_RE = re.compile(
+    "^(?:"
+    + "|".join(
+        f"(?P<{section}>"
+        + "|".join(re.escape(pattern) for pattern in dict.fromkeys(patterns))
+        + ")"
+        for section, patterns in SECTION_PATTERNS.items()
+    )
+    + r")s?(?:\s*:)?$"
+)
+# Word sets of every heading pattern for the word-overlap fallback
+_PATTERN_WORDS = [
+    (section, frozenset(pattern.split()))
+    for section, patterns in SECTION_PATTERNS.items()
+    for pattern in patterns
+]
+# Without a trailing colon a heading is a pattern plus an optional "s", so
+# longer lines can be rejected without running the regex
+_MAX_HEADING_LEN = max(len(p) for ps in SECTION_PATTERNS.values() for p in ps) + 1
+
+# CVProcessedData fields produced by processing, copied as-is when an identical
+# CV file has already been processed
+_PROCESSED_CV_FIELDS = (
+    "summary",
+    "experience",
+    "education",
+    "skills",
+    "projects",
+    "certifications",
+    "extracted_skills",
+    "experience_details",
+    "achievements",
+    "embedding_blob",
+    "embedding_rows",
+    "content_hash",
+)
+
+# Section and skill parsing patterns, compiled once at import
+_SKILL_SPLIT_RE = re.compile(r"[,;•\n]|\s{2,}")
+_PARAGRAPH_SPLIT_RE = re.compile(r"\n{2,}")
+_YEARS_RE = re.compile(r"\((\d+)")
+_EXPERIENCE_RES = (
+    re.compile(
+        r"(\d+)(?:\+)?\s*(?:years?|yrs?)\s*(?:of)?\s*experience\s*(?:with|in|using)?\s*([a-zA-Z0-9#\+\.\s]+)"
+    ),
+    re.compile(
+        r"([a-zA-Z0-9#\+\.\s]+)\s*(?:with)?\s*(\d+)(?:\+)?\s*(?:years?|yrs?)\s*(?:of)?\s*experience"
+    ),
+)
 
 
 class CVProcessor:
     def __init__(self, model_name="all-MiniLM-L6-v2"):
         # Initialize SBERT model
+        self.model_name = model_name
         try:
-            self.model = SentenceTransformer(model_name)
+            self.model = get_sentence_transformer(model_name)
         except Exception as e:
             logger.error(f"Error initializing SBERT model: {e}")
             self.model = None
 
-        # Load IT skills list
-        try:
-            with open(os.path.join(settings.BASE_DIR, "AI", "it_skills.txt"), "r") as f:
-                self.it_skills = [line.strip().lower() for line in f.readlines()]
-        except Exception as e:
-            logger.error(f"Error loading IT skills list: {e}")
-            self.it_skills = []
-
-        # Define section patterns
-        self.section_patterns = {
-            "summary": [
-                "summary",
-                "professional summary",
-                "profile",
-                "about me",
-                "personal statement",
-                "objective",
-                "career objective",
-            ],
-            "experience": [
-                "experience",
-                "work experience",
-                "employment history",
-                "work history",
-                "professional experience",
-                "experiences",
-                "work experiences",
-                "work history",
-                "experience summary",
-                "career history",
-            ],
-            "education": [
-                "education",
-                "academic background",
-                "academic history",
-                "qualifications",
-                "educations",
-                "education summary",
-                "education history",
-                "education background",
-                "education summary",
-                "education history",
-                "education background",
-            ],
-            "skills": [
-                "skills",
-                "technical skills",
-                "core competencies",
-                "key skills",
-                "expertise",
-                "skills summary",
-                "tech stack",
-                "technical expertise",
-            ],
-            "projects": [
-                "projects",
-                "personal projects",
-                "professional projects",
-                "key projects",
-                "projects summary",
-                "project summary",
-                "project experience",
-                "highlighted projects",
-            ],
-            "certifications": [
-                "certifications",
-                "certificates",
-                "professional certifications",
-            ],
-            "languages": [
-                "language",
-                "languages",
-                "language proficiency",
-                "language skills",
-            ],
-            "achievements": [
-                "achievements",
-                "awards",
-                "honors",
-                "accomplishments",
-                "prizes",
-                "awards",
-                "prizes and awards",
-            ],
-        }
+        # IT skills list and section tables are module-level constants
+        self.it_skills = load_it_skills()
+        self.section_patterns = SECTION_PATTERNS
+        self.section_mapping = SECTION_MAPPING
 
-        # Section mapping for normalization
-        self.section_mapping = {
-            "summary": "summary",
-            "profile": "summary",
-            "about": "summary",
-            "experience": "experience",
-            "work": "experience",
-            "employment": "experience",
-            "education": "education",
-            "academic": "education",
-            "qualifications": "education",
-            "skills": "skills",
-            "technical": "skills",
-            "competencies": "skills",
-            "expertise": "skills",
-            "projects": "projects",
-            "certifications": "certifications",
-            "certificates": "certifications",
-            "languages": "languages",
-            "achievements": "achievements",
-            "awards": "achievements",
-            "honors": "achievements",
-        }
+        # Single-pass matcher over the IT skills list
+        self._skill_matcher = get_skill_matcher()
 
     def extract_text_from_pdf(self, pdf_path):
         try:
-            text = ""
+            # Collect page texts and join once instead of repeated concatenation
             with fitz.open(pdf_path) as doc:
-                for page in doc:
-                    text += page.get_text()
-            return text
+                return "".join(page.get_text("text", sort=False) for page in doc)
+        except Exception as e:
+            logger.error(f"Error extracting text from PDF: {e}")
+            return ""
+
+    def extract_text_from_pdf_bytes(self, data):
+        try:
+            # PyMuPDF opens the document straight from memory
+            with fitz.open(stream=data, filetype="pdf") as doc:
+                return "".join(page.get_text("text", sort=False) for page in doc)
         except Exception as e:
             logger.error(f"Error extracting text from PDF: {e}")
             return ""
@@ -167,114 +267,20 @@ class CVProcessor:
             return ""
 
     def clean_text(self, text):
-        if not text:
-            return ""
-
-        # Remove HTML tags
-        text = re.sub(r"<.*?>", " ", text)
-
-        # Normalize line breaks
-        text = re.sub(r"\s*\n\s*", " ", text)
-
-        # Normalize punctuation
-        text = re.sub(r"\.(?=[A-Za-z])", ". ", text)
-
-        # Remove extra whitespace
-        text = re.sub(r"\s+", " ", text).strip()
-
-        return text
+        return clean_text(text)
 
     def advanced_preprocessing(self, text):
-        if not text:
-            return ""
-
-        # Basic cleaning
-        text = self.clean_text(text)
-
-        # Process IT abbreviations
-        abbreviations = {
-            r"\bjs\b": "javascript",
-            r"\bts\b": "typescript",
-            r"\bpy\b": "python",
-            r"\bml\b": "machine learning",
-            r"\bai\b": "artificial intelligence",
-            r"\boop\b": "object oriented programming",
-            r"\bui\b": "user interface",
-            r"\bux\b": "user experience",
-            r"\bfe\b": "frontend",
-            r"\bbe\b": "backend",
-            r"\bfs\b": "fullstack",
-            r"\bapi\b": "application programming interface",
-            r"\bsql\b": "structured query language",
-            r"\bnosql\b": "non-relational database",
-            r"\bci\b": "continuous integration",
-            r"\bcd\b": "continuous deployment",
-            r"\bdb\b": "database",
-            r"\bide\b": "integrated development environment",
-            r"\boop\b": "object-oriented programming",
-            r"\bfp\b": "functional programming",
-            r"\bqa\b": "quality assurance",
-            r"\bsdk\b": "software development kit",
-            r"\bapi\b": "application programming interface",
-            r"\bros\b": "robot operating system",
-            r"\bos\b": "operating system",
-            r"\bui/ux\b": "user interface and user experience",
-        }
+        return advanced_preprocessing(text)
 
-        for abbr, full in abbreviations.items():
-            text = re.sub(abbr, full, text, flags=re.IGNORECASE)
-
-        # Normalize technology names
-        tech_variants = {
-            r"react\.?js": "react",
-            r"node\.?js": "node",
-            r"angular(?:js)?(?:\s*[0-9.]+)?": "angular",
-            r"vue\.?js": "vue",
-            r"express\.?js": "express",
-            r"next\.?js": "nextjs",
-            r"mongo\s*db": "mongodb",
-            r"postgre(?:s|sql)": "postgresql",
-            r"ms\s*sql": "mssql",
-            r"my\s*sql": "mysql",
-            r"type\s*script": "typescript",
-            r"java\s*script": "javascript",
-            r"dotnet": ".net",
-            r"asp\.net(?:\s*core)?": "asp.net",
-            r"laravel\s*[0-9.]*": "laravel",
-            r"spring\s*boot": "spring boot",
-            r"spring\s*framework": "spring",
-            r"django\s*[0-9.]*": "django",
-            r"flask\s*[0-9.]*": "flask",
-            r"ruby\s*on\s*rails": "ruby on rails",
-            r"tensorflow\s*[0-9.]*": "tensorflow",
-            r"pytorch\s*[0-9.]*": "pytorch",
-            r"kubernetes": "k8s",
-            r"docker\s*compose": "docker-compose",
-            r"github\s*actions": "github actions",
-            r"gitlab\s*ci": "gitlab ci",
-            r"jenkins\s*[0-9.]*": "jenkins",
-        }
-
-        for variant, standard in tech_variants.items():
-            text = re.sub(variant, standard, text, flags=re.IGNORECASE)
-
-        return text
-
-    def enhance_cv_section(self, text, section_name):
+    def enhance_cv_section(self, text, section_name, doc=None):
+        # Text is expected to be preprocessed already (see advanced_preprocessing)
         if not text:
             return ""
 
-        # Apply advanced preprocessing
-        text = self.advanced_preprocessing(text)
-
-        # Extract sentences for better semantic understanding
-        doc = nlp(text)
-        sentences = [sent.text for sent in doc.sents]
-
         # Format based on section type
         if section_name == "skills":
             # Extract skill phrases
-            skill_phrases = re.split(r"[,;•\n]|\s{2,}", text)
+            skill_phrases = _SKILL_SPLIT_RE.split(text)
             skill_phrases = [
                 phrase.strip() for phrase in skill_phrases if phrase.strip()
             ]
@@ -284,10 +290,15 @@ class CVProcessor:
 
         elif section_name in ["experience", "education"]:
             # Keep paragraph structure but enhance readability
-            paragraphs = re.split(r"\n{2,}", text)
+            paragraphs = _PARAGRAPH_SPLIT_RE.split(text)
             formatted_text = "\n\n".join(paragraphs)
 
         else:
+            # Extract sentences for better semantic understanding
+            if doc is None:
+                doc = get_nlp()(text)
+            sentences = [sent.text for sent in doc.sents]
+
             # Default formatting for other sections
             formatted_text = "\n".join(sentences)
 
@@ -304,6 +315,18 @@ class CVProcessor:
             logger.error(f"Unsupported file format: {file_ext}")
             return ""
 
+    def extract_cv_content_from_bytes(self, data, file_name):
+        file_ext = os.path.splitext(file_name)[1].lower()
+
+        if file_ext == ".pdf":
+            return self.extract_text_from_pdf_bytes(data)
+        elif file_ext == ".docx":
+            # docx2txt accepts any file-like object
+            return self.extract_text_from_docx(io.BytesIO(data))
+        else:
+            logger.error(f"Unsupported file format: {file_ext}")
+            return ""
+
     def identify_sections_by_headings(self, text):
         if not text:
             return {}
@@ -323,18 +346,13 @@ class CVProcessor:
             is_heading = False
             section_type = None
 
-            # Check against section patterns
-            for section, patterns in self.section_patterns.items():
-                for pattern in patterns:
-                    # Match exact or with trailing colon or similar endings
-                    if re.match(
-                        rf"^{re.escape(pattern)}(\s*:|)$", line_text
-                    ) or re.match(rf"^{re.escape(pattern)}s(\s*:|)$", line_text):
-                        is_heading = True
-                        section_type = section
-                        break
-                if is_heading:
-                    break
+            # Check against section patterns (exact, plural or with trailing colon)
+            heading_match = None
+            if len(line_text) <= _MAX_HEADING_LEN or line_text.endswith(":"):
+                heading_match = _HEADING_RE.match(line_text)
+            if heading_match:
+                is_heading = True
+                section_type = heading_match.lastgroup
 
             # If heading found, save previous section and start new one
             if is_heading and section_type:
@@ -355,9 +373,9 @@ class CVProcessor:
         section_title = section_title.lower().strip()
 
         # Direct match with section patterns
-        for section, patterns in self.section_patterns.items():
-            if section_title in patterns:
-                return section
+        section = _PATTERN_TO_SECTION.get(section_title)
+        if section is not None:
+            return section
 
         # Check for partial matches
         for key_word, section in self.section_mapping.items():
@@ -379,13 +397,11 @@ class CVProcessor:
         best_match = None
         highest_similarity = 0
 
-        for section, patterns in self.section_patterns.items():
-            for pattern in patterns:
+        title_words = set(title_lower.split())
+        if title_words:
+            for section, pattern_words in _PATTERN_WORDS:
                 # Calculate simple word overlap similarity
-                pattern_words = set(pattern.split())
-                title_words = set(title_lower.split())
-
-                if pattern_words and title_words:
+                if pattern_words:
                     common_words = pattern_words.intersection(title_words)
                     similarity = len(common_words) / max(
                         len(pattern_words), len(title_words)
@@ -401,31 +417,27 @@ class CVProcessor:
 
         return "other"
 
-    def extract_skills_from_text(self, text):
+    def extract_skills_from_text(self, text, preprocessed=False):
         if not text:
             return []
 
-        # Apply advanced preprocessing
-        text = self.advanced_preprocessing(text.lower())
-
-        extracted_skills = []
+        # Apply advanced preprocessing unless the caller already did
+        text = text.lower()
+        if not preprocessed:
+            text = self.advanced_preprocessing(text)
 
         # Extract skills from IT skills list
-        for skill in self.it_skills:
-            if re.search(r"\b" + re.escape(skill) + r"\b", text):
-                extracted_skills.append(skill)
+        found_skills = self._skill_matcher.find(text)
+
+        # Keep the order of the IT skills list
+        extracted_skills = [skill for skill in self.it_skills if skill in found_skills]
 
         # Extract skills with experience levels
         skill_levels = {}
+        extracted_set = set(extracted_skills)
 
-        # Pattern for years of experience
-        experience_patterns = [
-            r"(\d+)(?:\+)?\s*(?:years?|yrs?)\s*(?:of)?\s*experience\s*(?:with|in|using)?\s*([a-zA-Z0-9#\+\.\s]+)",
-            r"([a-zA-Z0-9#\+\.\s]+)\s*(?:with)?\s*(\d+)(?:\+)?\s*(?:years?|yrs?)\s*(?:of)?\s*experience",
-        ]
-
-        for pattern in experience_patterns:
-            matches = re.finditer(pattern, text)
+        for exp_re in _EXPERIENCE_RES:
+            matches = exp_re.finditer(text)
             for match in matches:
                 if len(match.groups()) >= 2:
                     # Check if first group is years or skill based on pattern
@@ -437,14 +449,14 @@ class CVProcessor:
                         years = int(match.group(2))
 
                     # Clean up skill text
-                    skill_text = re.sub(r"\s+", " ", skill_text)
+                    skill_text = _WS_RE.sub(" ", skill_text)
 
                     # Check if this contains any known skills
-                    for skill in self.it_skills:
-                        if skill in skill_text:
-                            skill_levels[skill] = years
-                            if skill not in extracted_skills:
-                                extracted_skills.append(skill)
+                    for skill in self._skill_matcher.find_substrings(skill_text):
+                        skill_levels[skill] = years
+                        if skill not in extracted_set:
+                            extracted_set.add(skill)
+                            extracted_skills.append(skill)
 
         # Add experience level to skills
         final_skills = []
@@ -456,122 +468,334 @@ class CVProcessor:
 
         return final_skills
 
-    def process_cv(self, application):
+    def read_cv_file(self, application):
+        if not application.cv_file:
+            logger.error("No CV file found in application")
+            return None
+
+        # Read the file once; the bytes are hashed and parsed from memory, so
+        # remote files never go through a temporary file
+        with application.cv_file.open("rb") as source:
+            return source.read()
+
+    def compute_content_hash(self, data):
+        # Hash of the file bytes together with the processing version and the
+        # embedding path (model, backend, precision): a CV is only reused when
+        # the same pipeline would produce the same results
+        digest = hashlib.blake2b(digest_size=16)
+        signature = f"{CV_PROCESSING_VERSION}|{model_signature(self.model_name)}"
+        digest.update(signature.encode("utf-8") + b"\x00")
+        digest.update(data)
+        return digest.hexdigest()
+
+    def reuse_processed_cv(self, application, content_hash):
+        # An identical CV file was processed before (re-upload, task re-run):
+        # reuse its results instead of extracting and encoding it again
+        cached = CVProcessedData.objects.filter(
+            content_hash=content_hash, embedding_blob__isnull=False
+        ).first()
+        if cached is None:
+            return None
+        if cached.application_id == application.id:
+            return cached
+
+        cv_data, created = CVProcessedData.objects.update_or_create(
+            application=application,
+            defaults={field: getattr(cached, field) for field in _PROCESSED_CV_FIELDS},
+        )
+        return cv_data
+
+    def prepare_cv(self, application, data, content_hash):
+        # Everything before the embedding step: returns the fields to save and
+        # the texts to encode, so several CVs can share one encode call
+        cv_text = self.extract_cv_content_from_bytes(data, application.cv_file.name)
+        if not cv_text:
+            logger.error("Failed to extract text from CV")
+            return None
+
+        # Clean and preprocess text
+        cv_text = self.clean_text(cv_text)
+
+        # Identify sections
+        sections = self.identify_sections_by_headings(cv_text)
+
+        # Process sections; only those formatted sentence by sentence go
+        # through spaCy, all of them in one batch
+        section_items = [
+            (section_name, self.advanced_preprocessing(content))
+            for section_name, content in sections.items()
+            if section_name in SAVED_SECTIONS
+        ]
+        sentence_items = [
+            (section_name, text)
+            for section_name, text in section_items
+            if section_name not in NON_SENTENCE_SECTIONS
+        ]
+        docs = dict(
+            zip(
+                [section_name for section_name, _ in sentence_items],
+                get_nlp().pipe(
+                    [text for _, text in sentence_items],
+                    batch_size=8,
+                    n_process=1,
+                ),
+            )
+        )
+        processed_sections = {}
+        for section_name, text in section_items:
+            processed_sections[section_name] = self.enhance_cv_section(
+                text, section_name, docs.get(section_name)
+            )
+
+        # Extract key information
+        summary = processed_sections.get("summary", "")
+        experience = processed_sections.get("experience", "")
+        education = processed_sections.get("education", "")
+        skills = processed_sections.get("skills", "")
+        projects = processed_sections.get("projects", "")
+        certifications = processed_sections.get("certifications", "")
+        achievements = processed_sections.get("achievements", "")
+
+        # Extract skills (sections are already preprocessed above)
+        extracted_skills = self.extract_skills_from_text(
+            skills + " " + experience, preprocessed=True
+        )
+
+        # Extract experience details with years
+        experience_details = {}
+        for skill in extracted_skills:
+            base_skill = skill.split(" (")[0]
+            if " (" in skill and "year" in skill.lower():
+                years_match = _YEARS_RE.search(skill)
+                if years_match:
+                    experience_details[base_skill] = int(years_match.group(1))
+
+        # Create combined text for embedding
+        combined_text = f"{summary} {experience} {education} {skills}"
+
+        # Texts to embed: the full text split into token windows, combined
+        # text, then every non-empty section
+        section_names = [
+            section_name
+            for section_name, content in processed_sections.items()
+            if content.strip()
+        ]
+        full_text_chunks = self.split_into_token_windows(cv_text)
+        texts = (
+            full_text_chunks
+            + [combined_text]
+            + [processed_sections[section_name] for section_name in section_names]
+        )
+
+        return {
+            "fields": {
+                "summary": summary,
+                "experience": experience,
+                "education": education,
+                "skills": skills,
+                "projects": projects,
+                "certifications": certifications,
+                "extracted_skills": extracted_skills,
+                "experience_details": experience_details,
+                "achievements": achievements,
+                "content_hash": content_hash,
+            },
+            "embedding_rows": ["full", "combined"] + section_names,
+            "full_text_chunks": len(full_text_chunks),
+            "texts": texts,
+        }
+
+    def split_into_token_windows(self, text):
+        # The model only sees its first max_seq_length tokens, so a long CV is
+        # split into windows that are encoded together and mean-pooled
+        tokenizer = getattr(self.model, "tokenizer", None)
+        if tokenizer is None or not getattr(tokenizer, "is_fast", False):
+            return [text]
+
+        window = self.model.max_seq_length - 2  # room for [CLS] and [SEP]
+        offsets = tokenizer(
+            text, add_special_tokens=False, return_offsets_mapping=True
+        )["offset_mapping"]
+        if len(offsets) <= window:
+            return [text]
+
+        return [
+            text[offsets[start][0] : offsets[min(start + window, len(offsets)) - 1][1]]
+            for start in range(0, len(offsets), window)
+        ]
+
+    def encode_texts(self, texts, batch_size=16):
+        return self.model.encode(
+            texts,
+            batch_size=batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False,
+        )
+
+    def embedding_values(self, prepared, embeddings_matrix):
+        # Mean-pool the full text windows into a single unit-length row
+        chunk_count = prepared["full_text_chunks"]
+        if chunk_count > 1:
+            full_text_embedding = embeddings_matrix[:chunk_count].mean(axis=0)
+            full_text_embedding /= np.linalg.norm(full_text_embedding) or 1.0
+            embeddings_matrix = np.vstack(
+                [full_text_embedding, embeddings_matrix[chunk_count:]]
+            )
+
+        # The embeddings are stored on the row as one stacked float16 matrix
+        # (rows: full text, combined text, then sections) with its row names;
+        # float16 halves the size and is precise enough for cosine similarity
+        return {
+            "embedding_blob": embeddings_matrix.astype(np.float16).tobytes(),
+            "embedding_rows": prepared["embedding_rows"],
+        }
+
+    def save_cv(self, application, prepared, embeddings_matrix):
+        # Save processed data to database
+        cv_data, created = CVProcessedData.objects.update_or_create(
+            application=application,
+            defaults={
+                **prepared["fields"],
+                **self.embedding_values(prepared, embeddings_matrix),
+            },
+        )
+        return cv_data
+
+    def bulk_save_cvs(self, items, embeddings_matrix):
+        # Upsert a batch of (application, prepared) pairs with one
+        # INSERT ... ON CONFLICT (application_id) DO UPDATE; each CV takes its
+        # slice of rows of embeddings_matrix, in order. Returns the saved rows
+        # as stored in the database
+        if not items:
+            return []
+
+        objects = []
+        offset = 0
+        for application, prepared in items:
+            count = len(prepared["texts"])
+            objects.append(
+                CVProcessedData(
+                    application=application,
+                    **prepared["fields"],
+                    **self.embedding_values(
+                        prepared, embeddings_matrix[offset : offset + count]
+                    ),
+                )
+            )
+            offset += count
+
+        CVProcessedData.objects.bulk_create(
+            objects,
+            update_conflicts=True,
+            unique_fields=["application"],
+            update_fields=[
+                *items[0][1]["fields"],
+                "embedding_blob",
+                "embedding_rows",
+                "updated_at",
+            ],
+        )
+
+        # Updated rows keep their stored id, not the uuid4 of the objects
+        # passed to bulk_create
+        return list(
+            CVProcessedData.objects.filter(
+                application_id__in=[application.id for application, _ in items]
+            )
+        )
+
+    def process_cv(self, application, force=False):
+        # force skips reuse of earlier results, for explicit re-processing
         try:
-            if not application.cv or not application.cv.file:
-                logger.error("No CV file found in application")
+            data = self.read_cv_file(application)
+            if not data:
+                return None
+
+            content_hash = self.compute_content_hash(data)
+            if not force:
+                cv_data = self.reuse_processed_cv(application, content_hash)
+                if cv_data is not None:
+                    return cv_data
+
+            prepared = self.prepare_cv(application, data, content_hash)
+            if prepared is None:
                 return None
 
-            # Create a temporary file to process
-            with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-                temp_file_path = temp_file.name
+            # Generate full text, combined text and section embeddings in a
+            # single batched encode call
+            embeddings_matrix = self.encode_texts(prepared["texts"])
 
-                # Write CV content to temporary file
-                for chunk in application.cv.file.chunks():
-                    temp_file.write(chunk)
+            return self.save_cv(application, prepared, embeddings_matrix)
+        except Exception as e:
+            logger.error(f"Error processing CV: {e}")
+            logger.error(traceback.format_exc())
+            return None
 
+    def process_cv_batch(self, applications, batch_size=64, force=False):
+        # Bulk (re)processing: texts of every CV go through one encode call,
+        # then each CV takes its slice of rows back
+        prepared_items = []
+        results = []
+        for application in applications:
             try:
-                # Extract text from CV
-                cv_text = self.extract_cv_content(temp_file_path)
-                if not cv_text:
-                    logger.error("Failed to extract text from CV")
-                    return None
-
-                # Clean and preprocess text
-                cv_text = self.clean_text(cv_text)
-
-                # Identify sections
-                sections = self.identify_sections_by_headings(cv_text)
-
-                # Process sections
-                processed_sections = {}
-                for section_name, content in sections.items():
-                    if section_name != "other":
-                        processed_sections[section_name] = self.enhance_cv_section(
-                            content, section_name
-                        )
-
-                # Extract key information
-                summary = processed_sections.get("summary", "")
-                experience = processed_sections.get("experience", "")
-                education = processed_sections.get("education", "")
-                skills = processed_sections.get("skills", "")
-                projects = processed_sections.get("projects", "")
-                certifications = processed_sections.get("certifications", "")
-                achievements = processed_sections.get("achievements", "")
-
-                # Extract skills
-                extracted_skills = self.extract_skills_from_text(
-                    skills + " " + experience
+                data = self.read_cv_file(application)
+                if not data:
+                    continue
+
+                content_hash = self.compute_content_hash(data)
+                if not force:
+                    cv_data = self.reuse_processed_cv(application, content_hash)
+                    if cv_data is not None:
+                        results.append(cv_data)
+                        continue
+
+                prepared = self.prepare_cv(application, data, content_hash)
+            except Exception as e:
+                logger.error(
+                    f"Error processing CV for application {application.id}: {e}"
                 )
+                logger.error(traceback.format_exc())
+                continue
+            if prepared is not None:
+                prepared_items.append((application, prepared))
 
-                # Extract experience details with years
-                experience_details = {}
-                skill_patterns = [
-                    re.escape(skill.split(" (")[0]) for skill in extracted_skills
-                ]
-
-                for skill in extracted_skills:
-                    base_skill = skill.split(" (")[0]
-                    if " (" in skill and "year" in skill.lower():
-                        years_match = re.search(r"\((\d+)", skill)
-                        if years_match:
-                            experience_details[base_skill] = int(years_match.group(1))
-
-                # Create combined text for embedding
-                combined_text = f"{summary} {experience} {education} {skills}"
-
-                # Generate embeddings
-                full_text_embedding = self.model.encode(cv_text)
-                combined_text_embedding = self.model.encode(combined_text)
-
-                # Generate section embeddings
-                section_embeddings = {}
-                for section_name, content in processed_sections.items():
-                    if content.strip():
-                        section_embeddings[section_name] = self.model.encode(content)
-
-                # Save embeddings to file
-                embeddings = {
-                    "full_text": full_text_embedding.tolist(),
-                    "combined_text": combined_text_embedding.tolist(),
-                    "sections": {k: v.tolist() for k, v in section_embeddings.items()},
-                }
-
-                embedding_filename = f"cv_{application.cv.id}.json"
-                embedding_path = os.path.join(CV_DATA_DIR, embedding_filename)
-
-                with open(embedding_path, "w") as f:
-                    json.dump(embeddings, f)
-
-                # Save processed data to database
-                cv_data, created = CVProcessedData.objects.update_or_create(
-                    cv=application.cv,
-                    defaults={
-                        "summary": summary,
-                        "experience": experience,
-                        "education": education,
-                        "skills": skills,
-                        "projects": projects,
-                        "certifications": certifications,
-                        "extracted_skills": extracted_skills,
-                        "experience_details": experience_details,
-                        "achievements": achievements,
-                    },
-                )
+        if not prepared_items:
+            return results
 
-                return cv_data
-            finally:
-                # Clean up temporary file
-                if os.path.exists(temp_file_path):
-                    os.unlink(temp_file_path)
+        try:
+            embeddings_matrix = self.encode_texts(
+                [text for _, prepared in prepared_items for text in prepared["texts"]],
+                batch_size=batch_size,
+            )
+        except Exception as e:
+            logger.error(f"Error encoding CV batch: {e}")
+            logger.error(traceback.format_exc())
+            return results
 
+        try:
+            results.extend(self.bulk_save_cvs(prepared_items, embeddings_matrix))
         except Exception as e:
-            logger.error(f"Error processing CV: {e}")
+            logger.error(f"Error saving CV batch: {e}")
             logger.error(traceback.format_exc())
-            return None
+
+        return results
+
+
+@lru_cache(maxsize=1)
+def get_cv_processor():
+    # Shared processor so the model, skills list and compiled patterns are
+    # built once per process instead of once per application
+    return CVProcessor()
+
+
+def process_cv_on_application(application, force=False):
+    processor = get_cv_processor()
+    return processor.process_cv(application, force=force)
 
 
-def process_cv_on_application(application):
-    processor = CVProcessor()
-    return processor.process_cv(application)
+def process_cv_batch(applications, batch_size=64, force=False):
+    processor = get_cv_processor()
+    return processor.process_cv_batch(
+        applications, batch_size=batch_size, force=force
+    )
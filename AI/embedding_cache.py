@@ -0,0 +1,177 @@
+import os
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+import numpy as np
+from django.conf import settings
+from .model_loader import model_signature
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingCache:
+    """
+    Normalized SBERT embeddings keyed by SHA-256(embedding path, text): an
+    in-process LRU (float32) in front of one float16 .npy file per text on
+    disk. Only texts missing from both are encoded, in a single batch. The
+    disk layer is capped at max_files, least recently used files going first
+    """
+
+    # Writes between two checks of the disk layer size
+    PRUNE_INTERVAL = 1000
+
+    def __init__(self, model_name, cache_dir=None, max_items=10000, max_files=None):
+        # Model, backend, ONNX file and precision: vectors computed on another
+        # numeric path never share a key
+        self.signature = model_signature(model_name)
+        self.cache_dir = cache_dir or settings.EMBEDDING_CACHE_DIR
+        self.max_items = max_items
+        self.max_files = (
+            max_files if max_files is not None else settings.EMBEDDING_CACHE_MAX_FILES
+        )
+        self._memory = OrderedDict()
+        # The service is shared by request threads; the disk layer is safe
+        # through atomic renames, the in-memory LRU needs a lock
+        self._lock = threading.Lock()
+        # Start with a size check so a cache left over from an earlier run is
+        # capped too
+        self._writes = self.PRUNE_INTERVAL
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+        except OSError as e:
+            logger.error(f"Error creating embedding cache directory: {e}")
+
+    def _key(self, text):
+        return hashlib.sha256(f"{self.signature}:{text}".encode("utf-8")).hexdigest()
+
+    def _path(self, key):
+        # Two-character fan-out keeps directories small
+        return os.path.join(self.cache_dir, key[:2], f"{key}.npy")
+
+    def _remember(self, key, embedding):
+        with self._lock:
+            self._memory[key] = embedding
+            self._memory.move_to_end(key)
+            if len(self._memory) > self.max_items:
+                self._memory.popitem(last=False)
+
+    def _lookup(self, key):
+        with self._lock:
+            embedding = self._memory.get(key)
+            if embedding is not None:
+                self._memory.move_to_end(key)
+                return embedding
+
+        path = self._path(key)
+        if os.path.exists(path):
+            try:
+                embedding = np.load(path).astype(np.float32)
+                # Mark as recently used for pruning
+                os.utime(path)
+            except Exception as e:
+                logger.warning(f"Error reading cached embedding {path}: {e}")
+                return None
+            self._remember(key, embedding)
+            return embedding
+
+        return None
+
+    def _store(self, key, embedding):
+        self._remember(key, embedding)
+
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write to a temporary file first so concurrent readers never see
+            # a partial array; named per thread so two threads storing the
+            # same text do not share it
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                # float16 on disk halves the file size; cosine scores move by
+                # ~1e-3, well below what changes a ranking
+                np.save(f, embedding.astype(np.float16))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Error writing cached embedding {path}: {e}")
+            return
+
+        self._writes += 1
+        if self._writes >= self.PRUNE_INTERVAL:
+            self._writes = 0
+            self.prune()
+
+    def prune(self):
+        # Remove the least recently used files (by mtime) once the disk layer
+        # holds more than max_files, down to 90% of it
+        files = []
+        try:
+            with os.scandir(self.cache_dir) as subdirs:
+                for subdir in subdirs:
+                    if not subdir.is_dir():
+                        continue
+                    with os.scandir(subdir.path) as entries:
+                        for entry in entries:
+                            if entry.name.endswith(".npy"):
+                                files.append((entry.stat().st_mtime, entry.path))
+        except OSError as e:
+            logger.warning(f"Error scanning embedding cache: {e}")
+            return
+
+        if len(files) <= self.max_files:
+            return
+
+        files.sort()
+        for _, path in files[: len(files) - int(self.max_files * 0.9)]:
+            try:
+                os.remove(path)
+            except OSError:
+                # Already removed by another process
+                pass
+
+    def invalidate(self, text):
+        # Drop the cached embedding of text from memory and disk
+        key = self._key(text)
+        with self._lock:
+            self._memory.pop(key, None)
+
+        path = self._path(key)
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Error removing cached embedding {path}: {e}")
+
+    def encode(self, model, texts, batch_size=64):
+        # Returns one row per input text, in input order
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+
+        results = [None] * len(texts)
+        missing = {}
+        for index, text in enumerate(texts):
+            key = self._key(text)
+            embedding = self._lookup(key)
+            if embedding is not None:
+                results[index] = embedding
+            else:
+                # Identical texts in one call are encoded once
+                missing.setdefault(key, (text, []))[1].append(index)
+
+        if missing:
+            embeddings = model.encode(
+                [text for text, _ in missing.values()],
+                batch_size=batch_size,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+                show_progress_bar=False,
+            )
+            for (key, (_, indexes)), embedding in zip(missing.items(), embeddings):
+                embedding = embedding.astype(np.float32, copy=False)
+                self._store(key, embedding)
+                for index in indexes:
+                    results[index] = embedding
+
+        return np.stack(results)
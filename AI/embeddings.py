@@ -0,0 +1,17 @@
+import numpy as np
+
+# Embeddings are L2-normalized, so every component lies in [-1, 1] and one
+# global scale maps them onto the int8 range
+INT8_SCALE = 127.0
+
+
+def quantize_embedding(embedding):
+    # float vector -> int8 bytes, 4x smaller than float32
+    embedding = np.asarray(embedding, dtype=np.float32)
+    quantized = np.clip(np.round(embedding * INT8_SCALE), -128, 127)
+    return quantized.astype(np.int8).tobytes()
+
+
+def dequantize_embedding(data):
+    # int8 bytes -> float32 vector
+    return np.frombuffer(data, dtype=np.int8).astype(np.float32) / INT8_SCALE
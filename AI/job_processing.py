@@ -1,131 +1,123 @@
-import os
 import re
-import json
-import numpy as np
-from sentence_transformers import SentenceTransformer
+import time
+import hashlib
 import logging
-from django.conf import settings
 from .models import JobProcessedData
-import traceback
+from .model_loader import get_sentence_transformer
+from .embeddings import quantize_embedding
+from .text_utils import (
+    advanced_preprocessing,
+    clean_text,
+    get_skill_matcher,
+    load_it_skills,
+)
+from functools import lru_cache
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
-# Directory for processed job data
-JOB_DATA_DIR = os.path.join(settings.BASE_DIR, "AI", "job_processed_data")
-os.makedirs(JOB_DATA_DIR, exist_ok=True)
+# Regex patterns compiled once at import instead of on every call
+_WS_RE = re.compile(r"\s+")
+_ITEM_SPLIT_RE = re.compile(r"(?:\r?\n)|(?:•|\*|\-|\d+\.)\s*")
+_FILLER_WORDS_RE = re.compile(r"\b(and|with|for|the|or)\b")
+# Common variations of technology names, built once instead of per call
+_TECH_MAPPING = {
+    "js": "javascript",
+    "ts": "typescript",
+    "py": "python",
+    "c#": "csharp",
+    ".net": "dotnet",
+    "react.js": "react",
+    "reactjs": "react",
+    "node.js": "node",
+    "nodejs": "node",
+    "vue.js": "vue",
+    "vuejs": "vue",
+    "angular.js": "angular",
+    "angularjs": "angular",
+    "next.js": "nextjs",
+    "mongodb": "mongodb",
+    "postgres": "postgresql",
+    "postgresql": "postgresql",
+    "mysql": "mysql",
+    "mssql": "mssql",
+    "sql server": "mssql",
+}
+_LEVEL_WORDS = frozenset(
+    ["advanced", "expert", "proficient", "intermediate", "basic", "beginner"]
+)
+_LEVEL_PATTERNS = [
+    (
+        re.compile(
+            r"(advanced|expert|proficient)\s+(?:knowledge\s+(?:of|in)\s+)?([a-zA-Z0-9\+\#\.]+)",
+            re.IGNORECASE,
+        ),
+        "expert",
+    ),
+    (
+        re.compile(
+            r"([a-zA-Z0-9\+\#\.]+)\s+(?:at\s+)?(advanced|expert|proficient)(?:\s+level)?",
+            re.IGNORECASE,
+        ),
+        "expert",
+    ),
+    (
+        re.compile(
+            r"(intermediate)\s+(?:knowledge\s+(?:of|in)\s+)?([a-zA-Z0-9\+\#\.]+)",
+            re.IGNORECASE,
+        ),
+        "intermediate",
+    ),
+    (
+        re.compile(
+            r"([a-zA-Z0-9\+\#\.]+)\s+(?:at\s+)?(intermediate)(?:\s+level)?",
+            re.IGNORECASE,
+        ),
+        "intermediate",
+    ),
+    (
+        re.compile(
+            r"(basic|beginner)\s+(?:knowledge\s+(?:of|in)\s+)?([a-zA-Z0-9\+\#\.]+)",
+            re.IGNORECASE,
+        ),
+        "beginner",
+    ),
+    (
+        re.compile(
+            r"([a-zA-Z0-9\+\#\.]+)\s+(?:at\s+)?(basic|beginner)(?:\s+level)?",
+            re.IGNORECASE,
+        ),
+        "beginner",
+    ),
+]
+_EXPERIENCE_PATTERNS = [
+    re.compile(
+        r"(\d+)(?:\+)?\s*(?:years|yrs)(?:\s*of)?\s*experience\s*(?:with|in|using)?\s*([a-zA-Z0-9\+\#\.\s]+)"
+    ),
+    re.compile(
+        r"experience\s*(?:with|in|using)?\s*([a-zA-Z0-9\+\#\.\s]+)(?:\s*for)?\s*(?:at\s*least)?\s*(\d+)(?:\+)?\s*(?:years|yrs)"
+    ),
+]
 
 
 class JobProcessor:
     def __init__(self, model_name="all-MiniLM-L6-v2"):
         # Initialize SBERT model
         try:
-            self.model = SentenceTransformer(model_name)
+            self.model = get_sentence_transformer(model_name)
         except Exception as e:
             logger.error(f"Error initializing SBERT model: {e}")
             self.model = None
 
-        # Load IT skills list
-        try:
-            with open(os.path.join(settings.BASE_DIR, "AI", "it_skills.txt"), "r") as f:
-                self.it_skills = [line.strip().lower() for line in f.readlines()]
-        except Exception as e:
-            logger.error(f"Error loading IT skills list: {e}")
-            self.it_skills = []
+        # IT skills list, loaded once per process
+        self.it_skills = load_it_skills()
+        self._skill_matcher = get_skill_matcher()
 
     def clean_text(self, text):
-        if not text:
-            return ""
-
-        # Remove HTML tags
-        text = re.sub(r"<.*?>", " ", text)
-
-        # Normalize line breaks
-        text = re.sub(r"\s*\n\s*", " ", text)
-
-        # Normalize punctuation
-        text = re.sub(r"\.(?=[A-Za-z])", ". ", text)
-
-        # Remove extra whitespace
-        text = re.sub(r"\s+", " ", text).strip()
-
-        return text
-
-    def advanced_preprocessing(self, text):
-        if not text:
-            return ""
-
-        # Basic cleaning
-        text = self.clean_text(text)
-
-        # Process IT abbreviations
-        abbreviations = {
-            r"\bjs\b": "javascript",
-            r"\bts\b": "typescript",
-            r"\bpy\b": "python",
-            r"\bml\b": "machine learning",
-            r"\bai\b": "artificial intelligence",
-            r"\boop\b": "object oriented programming",
-            r"\bui\b": "user interface",
-            r"\bux\b": "user experience",
-            r"\bfe\b": "frontend",
-            r"\bbe\b": "backend",
-            r"\bfs\b": "fullstack",
-            r"\bapi\b": "application programming interface",
-            r"\bsql\b": "structured query language",
-            r"\bnosql\b": "non-relational database",
-            r"\bci\b": "continuous integration",
-            r"\bcd\b": "continuous deployment",
-            r"\bdb\b": "database",
-            r"\bide\b": "integrated development environment",
-            r"\boop\b": "object-oriented programming",
-            r"\bfp\b": "functional programming",
-            r"\bqa\b": "quality assurance",
-            r"\bsdk\b": "software development kit",
-            r"\bapi\b": "application programming interface",
-            r"\bros\b": "robot operating system",
-            r"\bos\b": "operating system",
-            r"\bui/ux\b": "user interface and user experience",
-        }
-
-        for abbr, full in abbreviations.items():
-            text = re.sub(abbr, full, text, flags=re.IGNORECASE)
-
-        # Normalize technology names
-        tech_variants = {
-            r"react\.?js": "react",
-            r"node\.?js": "node",
-            r"angular(?:js)?(?:\s*[0-9.]+)?": "angular",
-            r"vue\.?js": "vue",
-            r"express\.?js": "express",
-            r"next\.?js": "nextjs",
-            r"mongo\s*db": "mongodb",
-            r"postgre(?:s|sql)": "postgresql",
-            r"ms\s*sql": "mssql",
-            r"my\s*sql": "mysql",
-            r"type\s*script": "typescript",
-            r"java\s*script": "javascript",
-            r"dotnet": ".net",
-            r"asp\.net(?:\s*core)?": "asp.net",
-            r"laravel\s*[0-9.]*": "laravel",
-            r"spring\s*boot": "spring boot",
-            r"spring\s*framework": "spring",
-            r"django\s*[0-9.]*": "django",
-            r"flask\s*[0-9.]*": "flask",
-            r"ruby\s*on\s*rails": "ruby on rails",
-            r"tensorflow\s*[0-9.]*": "tensorflow",
-            r"pytorch\s*[0-9.]*": "pytorch",
-            r"kubernetes": "k8s",
-            r"docker\s*compose": "docker-compose",
-            r"github\s*actions": "github actions",
-            r"gitlab\s*ci": "gitlab ci",
-            r"jenkins\s*[0-9.]*": "jenkins",
-        }
+        return clean_text(text)
 
-        for variant, standard in tech_variants.items():
-            text = re.sub(variant, standard, text, flags=re.IGNORECASE)
-
-        return text
+    def advanced_preprocessing(self, text, cleaned=False):
+        return advanced_preprocessing(text, cleaned)
 
     def enhance_semantic_structure(self, text, section_title):
         if not text:
@@ -135,37 +127,41 @@ class JobProcessor:
         text = self.advanced_preprocessing(text)
 
         # Split items in list
-        items = re.split(r"(?:\r?\n)|(?:•|\*|\-|\d+\.)\s*", text)
-        items = [item.strip() for item in items if item.strip()]
-
-        # Format with clear structure
-        formatted_text = f"{section_title}:\n"
-        for i, item in enumerate(items, 1):
-            formatted_text += f"• {item}\n"
+        items = (item.strip() for item in _ITEM_SPLIT_RE.split(text))
 
-        return formatted_text
+        # Format with clear structure, joined once instead of repeated +=
+        bullets = "".join(f"• {item}\n" for item in items if item)
+        return f"{section_title}:\n{bullets}"
 
-    def extract_skills_from_text(self, text, skill_tags=None):
+    def extract_skills_from_text(
+        self, text, skill_tags=None, already_preprocessed=False
+    ):
         if not text:
             return []
 
-        # Apply advanced preprocessing
-        text = self.advanced_preprocessing(text.lower())
+        # Apply advanced preprocessing unless the caller already did
+        if not already_preprocessed:
+            text = self.advanced_preprocessing(text.lower())
 
         extracted_skills = []
+        # Lowercased names already extracted, for O(1) duplicate checks
+        seen = set()
 
-        # Search from skill_tags (from database)
         if skill_tags:
+            # Skill tags set on the job (from database) are authoritative, so
+            # the text is not scanned against the whole IT skills list
             for skill in skill_tags:
-                if re.search(r"\b" + re.escape(skill.name.lower()) + r"\b", text):
+                skill_name = skill.name.lower()
+                if skill_name not in seen:
                     extracted_skills.append(skill.name)
-
-        # Search from IT skills list
-        for skill in self.it_skills:
-            if skill not in [s.lower() for s in extracted_skills] and re.search(
-                r"\b" + re.escape(skill) + r"\b", text
-            ):
-                extracted_skills.append(skill)
+                    seen.add(skill_name)
+        else:
+            # Search from IT skills list, all skills in one pass over the text
+            found_skills = self._skill_matcher.find(text)
+            for skill in self.it_skills:
+                if skill not in seen and skill in found_skills:
+                    extracted_skills.append(skill)
+                    seen.add(skill)
 
         # Extract skills with required levels
         skill_levels = self.extract_skill_levels(text)
@@ -173,8 +169,9 @@ class JobProcessor:
         # Combine results
         final_skills = []
         for skill in extracted_skills:
-            if skill.lower() in skill_levels:
-                final_skills.append(f"{skill} ({skill_levels[skill.lower()]})")
+            level = skill_levels.get(skill.lower())
+            if level:
+                final_skills.append(f"{skill} ({level})")
             else:
                 final_skills.append(skill)
 
@@ -187,46 +184,12 @@ class JobProcessor:
         skill_levels = {}
 
         # Look for skill level patterns
-        level_patterns = [
-            (
-                r"(advanced|expert|proficient)\s+(?:knowledge\s+(?:of|in)\s+)?([a-zA-Z0-9\+\#\.]+)",
-                "expert",
-            ),
-            (
-                r"([a-zA-Z0-9\+\#\.]+)\s+(?:at\s+)?(advanced|expert|proficient)(?:\s+level)?",
-                "expert",
-            ),
-            (
-                r"(intermediate)\s+(?:knowledge\s+(?:of|in)\s+)?([a-zA-Z0-9\+\#\.]+)",
-                "intermediate",
-            ),
-            (
-                r"([a-zA-Z0-9\+\#\.]+)\s+(?:at\s+)?(intermediate)(?:\s+level)?",
-                "intermediate",
-            ),
-            (
-                r"(basic|beginner)\s+(?:knowledge\s+(?:of|in)\s+)?([a-zA-Z0-9\+\#\.]+)",
-                "beginner",
-            ),
-            (
-                r"([a-zA-Z0-9\+\#\.]+)\s+(?:at\s+)?(basic|beginner)(?:\s+level)?",
-                "beginner",
-            ),
-        ]
-
-        for pattern, level in level_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        for pattern, level in _LEVEL_PATTERNS:
+            matches = pattern.finditer(text)
             for match in matches:
                 if len(match.groups()) >= 2:
                     # Check which group is the skill based on pattern
-                    if match.group(1).lower() in [
-                        "advanced",
-                        "expert",
-                        "proficient",
-                        "intermediate",
-                        "basic",
-                        "beginner",
-                    ]:
+                    if match.group(1).lower() in _LEVEL_WORDS:
                         skill = match.group(2).lower()
                     else:
                         skill = match.group(1).lower()
@@ -235,40 +198,33 @@ class JobProcessor:
                     skill = skill.strip()
 
                     # Check if this is a known skill
-                    for known_skill in self.it_skills:
-                        if (
-                            skill == known_skill
-                            or skill in known_skill
-                            or known_skill in skill
-                        ):
-                            skill_levels[known_skill] = level
-                            break
+                    known_skill = self._skill_matcher.find_overlapping(skill)
+                    if known_skill:
+                        skill_levels[known_skill] = level
                     else:
                         # If not found in known skills but seems valid, add it
-                        if len(skill) > 2 and not re.search(
-                            r"\b(and|with|for|the|or)\b", skill
-                        ):
+                        if len(skill) > 2 and not _FILLER_WORDS_RE.search(skill):
                             skill_levels[skill] = level
 
         return skill_levels
 
-    def extract_experience_requirements(self, text):
+    def extract_experience_requirements(self, text, already_preprocessed=False):
         if not text:
             return {}
 
-        # Apply advanced preprocessing
-        text = self.advanced_preprocessing(text.lower())
+        # Apply advanced preprocessing unless the caller already did
+        if not already_preprocessed:
+            text = self.advanced_preprocessing(text.lower())
+
+        # Both patterns need the word "experience"
+        if "experience" not in text:
+            return {}
 
         experience_requirements = {}
 
         # Look for patterns like "X years of experience in Y"
-        patterns = [
-            r"(\d+)(?:\+)?\s*(?:years|yrs)(?:\s*of)?\s*experience\s*(?:with|in|using)?\s*([a-zA-Z0-9\+\#\.\s]+)",
-            r"experience\s*(?:with|in|using)?\s*([a-zA-Z0-9\+\#\.\s]+)(?:\s*for)?\s*(?:at\s*least)?\s*(\d+)(?:\+)?\s*(?:years|yrs)",
-        ]
-
-        for pattern in patterns:
-            matches = re.finditer(pattern, text)
+        for pattern in _EXPERIENCE_PATTERNS:
+            matches = pattern.finditer(text)
             for match in matches:
                 if len(match.groups()) >= 2:
                     # Determine which group is years and which is skill
@@ -280,20 +236,18 @@ class JobProcessor:
                         years = int(match.group(2))
 
                     # Clean up skill text
-                    skill_text = re.sub(r"\s+", " ", skill_text)
+                    skill_text = _WS_RE.sub(" ", skill_text)
 
-                    # Check if this contains any known skills
-                    for skill in self.it_skills:
-                        if skill in skill_text:
-                            experience_requirements[skill] = years
-                            break
+                    # Check if this contains any known skills, first one in
+                    # the IT skills list wins
+                    known_skills = self._skill_matcher.find_substrings(skill_text)
+                    if known_skills:
+                        experience_requirements[known_skills[0]] = years
                     else:
                         # If no specific skill found, use the whole phrase
                         # but clean it up to be more like a technology name
-                        clean_skill = re.sub(
-                            r"\b(and|with|for|the|or)\b", "", skill_text
-                        )
-                        clean_skill = re.sub(r"\s+", " ", clean_skill).strip()
+                        clean_skill = _FILLER_WORDS_RE.sub("", skill_text)
+                        clean_skill = _WS_RE.sub(" ", clean_skill).strip()
 
                         if clean_skill and len(clean_skill) > 2:
                             experience_requirements[clean_skill] = years
@@ -307,109 +261,309 @@ class JobProcessor:
         # Convert to lowercase and trim
         tech = tech_name.lower().strip()
 
-        # Handle common variations
-        tech_mapping = {
-            "js": "javascript",
-            "ts": "typescript",
-            "py": "python",
-            "c#": "csharp",
-            ".net": "dotnet",
-            "react.js": "react",
-            "reactjs": "react",
-            "node.js": "node",
-            "nodejs": "node",
-            "vue.js": "vue",
-            "vuejs": "vue",
-            "angular.js": "angular",
-            "angularjs": "angular",
-            "next.js": "nextjs",
-            "mongodb": "mongodb",
-            "postgres": "postgresql",
-            "postgresql": "postgresql",
-            "mysql": "mysql",
-            "mssql": "mssql",
-            "sql server": "mssql",
-        }
-
         # Check for exact matches
-        if tech in tech_mapping:
-            return tech_mapping[tech]
+        normalized = _TECH_MAPPING.get(tech)
+        if normalized:
+            return normalized
 
         # Check for partial matches
-        for key, value in tech_mapping.items():
+        for key, value in _TECH_MAPPING.items():
             if key in tech:
                 return value
 
         # Return original if no match
         return tech
 
+    def prepare_job(self, job):
+        # Everything before the embedding step: returns the fields to save and
+        # the texts to encode, so several jobs can share one encode call
+        title = job.title or ""
+        description = job.description or ""
+        responsibilities = job.responsibilities or ""
+        basic_requirements = job.requirements or ""
+        preferred_skills = job.preferred_skills or ""
+
+        # Clean and preprocess text
+        title_clean = self.clean_text(title)
+        description_clean = self.clean_text(description)
+        responsibilities_clean = self.clean_text(responsibilities)
+        basic_requirements_clean = self.clean_text(basic_requirements)
+        preferred_skills_clean = self.clean_text(preferred_skills)
+
+        # Skill tags from the database, fetched once (served from the
+        # prefetch cache when the job comes from process_jobs)
+        skill_tags = list(job.skills.all())
+
+        # Preprocess each field once; both extractors share the results
+        requirements_prep = self.advanced_preprocessing(
+            basic_requirements_clean.lower(), cleaned=True
+        )
+        preferred_skills_prep = self.advanced_preprocessing(
+            preferred_skills_clean.lower(), cleaned=True
+        )
+
+        # Extract skills from requirements and preferred skills, the fields
+        # where skills are actually listed
+        extracted_skills = self.extract_skills_from_text(
+            requirements_prep + " " + preferred_skills_prep,
+            skill_tags,
+            already_preprocessed=True,
+        )
+
+        # Extract experience requirements
+        experience_requirements = self.extract_experience_requirements(
+            requirements_prep, already_preprocessed=True
+        )
+
+        # Create combined text for embedding, joined once
+        parts = [
+            title_clean,
+            description_clean,
+            responsibilities_clean,
+            basic_requirements_clean,
+        ]
+        if preferred_skills_clean:
+            parts.append(preferred_skills_clean)
+        combined_text = " ".join(parts)
+
+        # Texts embedded at ingest, one matrix row each: the combined text plus
+        # the exact job-side texts matching compares against CV sections, so
+        # matching does not have to encode them again
+        texts = {"combined": combined_text}
+        if basic_requirements_clean:
+            texts["requirements"] = basic_requirements_clean
+        if responsibilities_clean:
+            texts["responsibilities"] = responsibilities_clean
+        if job.title:
+            texts["title"] = job.title
+        if job.preferred_skills:
+            texts["preferred_skills"] = job.preferred_skills
+        if extracted_skills:
+            texts["job_skills"] = ", ".join(extracted_skills)
+        hashed_text = "\x1e".join(f"{name}\x1f{text}" for name, text in texts.items())
+
+        return {
+            "fields": {
+                "title": title_clean,
+                "description": description_clean,
+                "responsibilities": responsibilities_clean,
+                "basic_requirements": basic_requirements_clean,
+                "skills": extracted_skills,
+                "experience_requirements": experience_requirements,
+                "text_hash": hashlib.blake2b(
+                    hashed_text.encode("utf-8"), digest_size=16
+                ).hexdigest(),
+            },
+            "texts": texts,
+        }
+
+    def encode_texts(self, texts, batch_size=64):
+        # sentence-transformers sorts the texts by length internally, so
+        # each batch is padded to similar lengths
+        return self.model.encode(
+            texts,
+            batch_size=batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False,
+        )
+
+    def encode_jobs(self, prepared_list, batch_size=64):
+        # The texts of every job go through one encode call; returns one
+        # matrix per job with a row per text
+        texts = [
+            text for prepared in prepared_list for text in prepared["texts"].values()
+        ]
+        embeddings = self.encode_texts(texts, batch_size=batch_size)
+
+        matrices = []
+        start = 0
+        for prepared in prepared_list:
+            end = start + len(prepared["texts"])
+            matrices.append(embeddings[start:end])
+            start = end
+
+        return matrices
+
+    def save_job(self, job, prepared, embeddings):
+        # Save processed data and the embedding matrix (int8-quantized) in one
+        # row, instead of one .npy file per job
+        job_data, created = JobProcessedData.objects.update_or_create(
+            job=job,
+            defaults={
+                **prepared["fields"],
+                "embedding_blob": quantize_embedding(embeddings),
+                "embedding_rows": list(prepared["texts"]),
+                "embedding_file": "",
+            },
+        )
+
+        return job_data
+
+    def stored_text_hashes(self, jobs):
+        # job id -> text hash of the embeddings already saved for that job
+        return dict(
+            JobProcessedData.objects.filter(job__in=jobs)
+            .exclude(embedding_blob=None)
+            .values_list("job_id", "text_hash")
+        )
+
+    def save_job_fields(self, job, prepared):
+        # Embedded texts unchanged: refresh the extracted fields and keep the
+        # stored embeddings
+        job_data, created = JobProcessedData.objects.update_or_create(
+            job=job,
+            defaults=prepared["fields"],
+        )
+
+        return job_data
+
     def process_job(self, job):
+        # Each step has its own error handling and debug timing, so profiling
+        # shows whether text processing, encoding or the DB write dominates
+        started = time.perf_counter()
         try:
-            # Extract job details
-            title = job.title or ""
-            description = job.description or ""
-            responsibilities = job.responsibilities or ""
-            basic_requirements = job.basic_requirements or ""
-            preferred_skills = job.preferred_skills or []
-
-            # Clean and preprocess text
-            title_clean = self.clean_text(title)
-            description_clean = self.clean_text(description)
-            responsibilities_clean = self.clean_text(responsibilities)
-            basic_requirements_clean = self.clean_text(basic_requirements)
-
-            # Extract skills from requirements
-            extracted_skills = self.extract_skills_from_text(
-                basic_requirements_clean + " " + responsibilities_clean,
-                job.skill_tags.all() if hasattr(job, "skill_tags") else None,
-            )
+            prepared = self.prepare_job(job)
+        except Exception:
+            logger.exception("Error preparing job %s", job.id)
+            return None
+        logger.debug(
+            "Job %s: prepared in %.3fs", job.id, time.perf_counter() - started
+        )
 
-            # Extract experience requirements
-            experience_requirements = self.extract_experience_requirements(
-                basic_requirements_clean
-            )
+        try:
+            # Skip the forward pass when the texts to embed have not changed
+            stored_hash = self.stored_text_hashes([job]).get(job.id)
+            if stored_hash == prepared["fields"]["text_hash"]:
+                return self.save_job_fields(job, prepared)
+        except Exception:
+            logger.exception("Error saving job %s", job.id)
+            return None
+
+        started = time.perf_counter()
+        try:
+            embeddings = self.encode_jobs([prepared])[0]
+        except Exception:
+            logger.exception("Error encoding job %s", job.id)
+            return None
+        logger.debug(
+            "Job %s: encoded in %.3fs", job.id, time.perf_counter() - started
+        )
+
+        started = time.perf_counter()
+        try:
+            job_data = self.save_job(job, prepared, embeddings)
+        except Exception:
+            logger.exception("Error saving job %s", job.id)
+            return None
+        logger.debug(
+            "Job %s: saved in %.3fs", job.id, time.perf_counter() - started
+        )
+
+        return job_data
+
+    def process_jobs(self, jobs, batch_size=64):
+        # Bulk (re)processing: the texts of every job go through one encode
+        # call instead of one forward pass per job
+        if hasattr(jobs, "prefetch_related"):
+            # One query for the skill tags of the whole batch
+            jobs = jobs.prefetch_related("skills")
+
+        prepared_items = []
+        for job in jobs:
+            try:
+                prepared_items.append((job, self.prepare_job(job)))
+            except Exception:
+                logger.exception("Error processing job %s", job.id)
+
+        if not prepared_items:
+            return []
+
+        # Jobs whose embedded texts are unchanged keep their stored embeddings
+        stored_hashes = self.stored_text_hashes([job for job, _ in prepared_items])
+        unchanged = []
+        to_encode = []
+        for job, prepared in prepared_items:
+            if stored_hashes.get(job.id) == prepared["fields"]["text_hash"]:
+                unchanged.append((job, prepared))
+            else:
+                to_encode.append((job, prepared))
 
-            # Create combined text for embedding
-            combined_text = f"{title_clean} {description_clean} {responsibilities_clean} {basic_requirements_clean}"
-            if preferred_skills:
-                preferred_skills_text = ", ".join(preferred_skills)
-                combined_text += f" {preferred_skills_text}"
-
-            # Create embedding
-            embedding = self.model.encode(combined_text)
-
-            # Save embedding to file
-            embedding_filename = f"job_{job.id}.npy"
-            embedding_path = os.path.join(JOB_DATA_DIR, embedding_filename)
-            np.save(embedding_path, embedding)
-
-            # Save processed data to database
-            job_data, created = JobProcessedData.objects.update_or_create(
-                job=job,
-                defaults={
-                    "title": title_clean,
-                    "description": description_clean,
-                    "responsibilities": responsibilities_clean,
-                    "basic_requirements": basic_requirements_clean,
-                    "skills": extracted_skills,
-                    "experience_requirements": experience_requirements,
-                    "embedding_file": embedding_filename,
-                },
+        results = []
+        try:
+            results.extend(self.bulk_save_jobs(unchanged))
+        except Exception:
+            logger.exception("Error saving job batch")
+
+        if not to_encode:
+            return results
+
+        try:
+            embeddings = self.encode_jobs(
+                [prepared for _, prepared in to_encode], batch_size=batch_size
             )
+        except Exception:
+            logger.exception("Error encoding job batch")
+            return results
 
-            return job_data
+        try:
+            results.extend(self.bulk_save_jobs(to_encode, embeddings))
+        except Exception:
+            logger.exception("Error saving job batch")
+
+        return results
+
+    def bulk_save_jobs(self, items, embeddings=None):
+        # Upsert a batch of (job, prepared) pairs with one
+        # INSERT ... ON CONFLICT (job_id) DO UPDATE instead of a SELECT plus
+        # INSERT/UPDATE per job. Without embeddings the stored ones are kept.
+        # Returns the saved rows as stored in the database
+        if not items:
+            return []
 
-        except Exception as e:
-            logger.error(f"Error processing job: {e}")
-            logger.error(traceback.format_exc())
-            return None
+        update_fields = [*items[0][1]["fields"], "updated_at"]
+        if embeddings is not None:
+            update_fields += ["embedding_blob", "embedding_rows", "embedding_file"]
+
+        objects = []
+        for index, (job, prepared) in enumerate(items):
+            data = dict(prepared["fields"])
+            if embeddings is not None:
+                data["embedding_blob"] = quantize_embedding(embeddings[index])
+                data["embedding_rows"] = list(prepared["texts"])
+                data["embedding_file"] = ""
+            objects.append(JobProcessedData(job=job, **data))
+
+        JobProcessedData.objects.bulk_create(
+            objects,
+            update_conflicts=True,
+            unique_fields=["job"],
+            update_fields=update_fields,
+        )
+
+        # Objects passed to bulk_create keep their new uuid4 pk even when the
+        # row already existed and was updated, so read the rows back
+        return list(
+            JobProcessedData.objects.filter(job_id__in=[job.id for job, _ in items])
+        )
+
+
+@lru_cache(maxsize=1)
+def get_job_processor():
+    # Shared processor so the SBERT model is not reloaded for every job
+    return JobProcessor()
 
 
 def process_job_on_publish(job):
-    processor = JobProcessor()
+    processor = get_job_processor()
     return processor.process_job(job)
 
 
 def process_job_on_update(job):
-    processor = JobProcessor()
+    processor = get_job_processor()
     return processor.process_job(job)
+
+
+def process_jobs(jobs, batch_size=64):
+    processor = get_job_processor()
+    return processor.process_jobs(jobs, batch_size=batch_size)
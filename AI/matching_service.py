@@ -1,34 +1,75 @@
 import os
 import json
 import numpy as np
-from sentence_transformers import SentenceTransformer, util
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import logging
 from django.conf import settings
 from .models import JobProcessedData, CVProcessedData, JobCVMatch
+from .model_loader import get_sentence_transformer
+from .embedding_cache import EmbeddingCache
+from .text_utils import SkillCoverage, load_it_skills
+from .embeddings import dequantize_embedding
 import traceback
-from jobs.models import Job
-from application.models import JobApplication
 
 logger = logging.getLogger(__name__)
 
+# CVProcessedData columns read while matching; the section texts, full text
+# and combined text are large and not needed once embeddings exist
+_MATCH_CV_FIELDS = (
+    "id",
+    "application_id",
+    "experience",
+    "extracted_skills",
+    "experience_details",
+    "embedding_blob",
+    "embedding_rows",
+)
+
+
+@lru_cache(maxsize=256)
+def _mmap_npy(path, mtime):
+    # Memory-mapped and cached per (path, mtime), so a file rewritten on
+    # re-processing is picked up again. Each mapping holds a file descriptor,
+    # which keeps the cache well below the usual open-file limit
+    return np.load(path, mmap_mode="r")
+
+
+@lru_cache(maxsize=256)
+def _load_json_embedding(path, mtime):
+    with open(path, "r") as f:
+        data = json.load(f)
+    embedding = np.array(data["combined_text"])
+    # Shared between callers through the cache
+    embedding.setflags(write=False)
+    return embedding
+
+
+def _load_npy(path):
+    return _mmap_npy(path, os.path.getmtime(path))
+
+
+@lru_cache(maxsize=256)
+def _skill_coverage(job_skills):
+    # Built once per job skill list and shared by every CV matched against it
+    return SkillCoverage(job_skills)
+
 
 class MatchingService:
     def __init__(self, model_name="all-MiniLM-L6-v2"):
         try:
-            self.model = SentenceTransformer(model_name)
+            self.model = get_sentence_transformer(model_name)
         except Exception as e:
             logger.error(f"Error initializing SBERT model: {e}")
             self.model = None
 
+        # Cache for embeddings of texts encoded at match time
+        self.embedding_cache = EmbeddingCache(model_name)
+
         self.JOB_DATA_DIR = os.path.join(settings.BASE_DIR, "AI", "job_processed_data")
         self.CV_DATA_DIR = os.path.join(settings.BASE_DIR, "AI", "cv_processed_data")
 
-        try:
-            with open(os.path.join(settings.BASE_DIR, "AI", "it_skills.txt"), "r") as f:
-                self.it_skills = [line.strip().lower() for line in f.readlines()]
-        except Exception as e:
-            logger.error(f"Error loading IT skills list: {e}")
-            self.it_skills = []
+        self.it_skills = load_it_skills()
 
         # Weights for matching components
         self.exact_match_weight = 0.3
@@ -88,6 +129,28 @@ class MatchingService:
         total = sum(weights.values())
         return {k: v / total for k, v in weights.items()}
 
+    def get_job_skill_names(self, job_data):
+        # Lowercased job skill names, computed once per JobProcessedData
+        # instance and reused for every CV it is matched against
+        names = getattr(job_data, "_skill_names", None)
+        if names is None:
+            names = tuple(skill.lower() for skill in job_data.skills or [])
+            job_data._skill_names = names
+        return names
+
+    def get_cv_skill_names(self, cv_data):
+        # Lowercased CV skill names without the " (level)" suffix, plus their
+        # set, computed once per CVProcessedData instance
+        cached = getattr(cv_data, "_skill_names", None)
+        if cached is None:
+            names = [
+                skill.split(" (")[0].lower() if " (" in skill else skill.lower()
+                for skill in getattr(cv_data, "extracted_skills", None) or []
+            ]
+            cached = (names, frozenset(names))
+            cv_data._skill_names = cached
+        return cached
+
     def match_with_context(self, job_data, cv_data):
         # Context-aware matching
         context_scores = {}
@@ -114,29 +177,24 @@ class MatchingService:
                     context_scores[f"experience_{tech}"] = 0
 
         # Match skills with priority levels
-        important_skills = []
-        if job_data.skills:
-            important_skills = job_data.skills
-
-        extracted_skills = []
-        if hasattr(cv_data, "extracted_skills") and cv_data.extracted_skills:
-            extracted_skills = [
-                skill.split(" (")[0].lower() if " (" in skill else skill.lower()
-                for skill in cv_data.extracted_skills
-            ]
+        important_skills = self.get_job_skill_names(job_data)
+        extracted_skills, extracted_skills_set = self.get_cv_skill_names(cv_data)
+
+        # Job skills found partially (one name inside the other) in the CV
+        similar_skills = set()
+        if important_skills and extracted_skills:
+            similar_skills = _skill_coverage(important_skills).covered(
+                extracted_skills
+            )
 
-        for skill in important_skills:
-            skill_lower = skill.lower()
-            if skill_lower in extracted_skills:
+        for skill_lower in important_skills:
+            if skill_lower in extracted_skills_set:
                 context_scores[f"skill_{skill_lower}"] = 1.0
-            else:
+            elif skill_lower in similar_skills:
                 # Look for similar skills
-                for cv_skill in extracted_skills:
-                    if skill_lower in cv_skill or cv_skill in skill_lower:
-                        context_scores[f"skill_{skill_lower}"] = 0.7
-                        break
-                else:
-                    context_scores[f"skill_{skill_lower}"] = 0
+                context_scores[f"skill_{skill_lower}"] = 0.7
+            else:
+                context_scores[f"skill_{skill_lower}"] = 0
 
         # Calculate weighted average score
         if context_scores:
@@ -162,20 +220,22 @@ class MatchingService:
 
         # Get skills from job and CV
         job_skills = job_data.skills if job_data.skills else []
-        cv_skills = []
-        if hasattr(cv_data, "extracted_skills") and cv_data.extracted_skills:
-            cv_skills = [
-                skill.split(" (")[0].lower() if " (" in skill else skill.lower()
-                for skill in cv_data.extracted_skills
-            ]
+        job_skill_names = self.get_job_skill_names(job_data)
+        cv_skills, _ = self.get_cv_skill_names(cv_data)
+
+        # Whether each job skill is covered by the CV (exactly, or one name
+        # inside the other), decided once for both strengths and weaknesses
+        covered_skills = set()
+        if job_skills and cv_skills:
+            covered_skills = _skill_coverage(job_skill_names).covered(cv_skills)
+        skill_found = {
+            skill: name in covered_skills
+            for skill, name in zip(job_skills, job_skill_names)
+        }
 
         # Find matching skills
         for skill in job_skills:
-            skill_lower = skill.lower()
-            if any(
-                skill_lower in cv_skill or cv_skill in skill_lower
-                for cv_skill in cv_skills
-            ):
+            if skill_found[skill]:
                 strengths.append(f"Candidate has experience with {skill}")
 
         # Check experience
@@ -202,11 +262,7 @@ class MatchingService:
 
         # Find missing skills
         for skill in job_skills:
-            skill_lower = skill.lower()
-            if not any(
-                skill_lower in cv_skill or cv_skill in skill_lower
-                for cv_skill in cv_skills
-            ):
+            if not skill_found[skill]:
                 weaknesses.append(f"Job requires {skill} which was not found in the CV")
 
         # Check missing experience
@@ -249,14 +305,75 @@ class MatchingService:
             "explanation": explanation,
         }
 
+    def split_cv_embeddings(self, matrix, names):
+        # One contiguous float32 matrix; the returned vectors are row views
+        matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+        rows = dict(zip(names, matrix))
+        return {
+            "full_text": rows.pop("full"),
+            "combined_text": rows.pop("combined"),
+            "sections": rows,
+        }
+
+    def get_cv_embeddings(self, cv_data):
+        # Embeddings stored on the CVProcessedData row as a float16 matrix
+        if cv_data.embedding_blob and cv_data.embedding_rows:
+            matrix = np.frombuffer(cv_data.embedding_blob, dtype=np.float16)
+            return self.split_cv_embeddings(
+                matrix.reshape(len(cv_data.embedding_rows), -1),
+                cv_data.embedding_rows,
+            )
+
+        # CVs processed before that are still stored in files
+        cv_file_path = os.path.join(self.CV_DATA_DIR, f"cv_{cv_data.id}.npz")
+        if not os.path.exists(cv_file_path):
+            cv_file_path = os.path.join(self.CV_DATA_DIR, f"cv_{cv_data.id}.json")
+        if not os.path.exists(cv_file_path):
+            logger.error(f"CV embedding file not found: {cv_file_path}")
+            return None
+
+        return self.load_cv_embeddings(cv_file_path)
+
+    def get_job_embeddings(self, job_data):
+        # Embeddings stored on the JobProcessedData row as an int8 matrix with
+        # one row per text; rows saved before per-text embeddings only hold
+        # the combined text
+        if job_data.embedding_blob:
+            names = job_data.embedding_rows or ["combined"]
+            matrix = dequantize_embedding(job_data.embedding_blob)
+            rows = dict(zip(names, matrix.reshape(len(names), -1)))
+            return {"combined_text": rows.pop("combined"), "sections": rows}
+
+        # Jobs processed before that are still stored in .npy files
+        job_file_path = os.path.join(self.JOB_DATA_DIR, f"job_{job_data.job_id}.npy")
+        if not os.path.exists(job_file_path):
+            logger.error(f"Job embedding file not found: {job_file_path}")
+            return None
+
+        return {"combined_text": _load_npy(job_file_path), "sections": {}}
+
+    def load_cv_embeddings(self, file_path):
+        # Stacked float16 matrix in .npz files; older CVs may still have the
+        # legacy JSON format
+        if file_path.endswith(".npz"):
+            with np.load(file_path) as data:
+                return self.split_cv_embeddings(
+                    data["embeddings"], data["names"].tolist()
+                )
+
+        with open(file_path, "r") as f:
+            return json.load(f)
+
     def load_embedding(self, file_path):
         try:
             if file_path.endswith(".npy"):
-                return np.load(file_path)
+                return _load_npy(file_path)
+            elif file_path.endswith(".npz"):
+                return self.load_cv_embeddings(file_path)["combined_text"]
             elif file_path.endswith(".json"):
-                with open(file_path, "r") as f:
-                    data = json.load(f)
-                return np.array(data["combined_text"])
+                return _load_json_embedding(
+                    file_path, os.path.getmtime(file_path)
+                )
             else:
                 logger.error(f"Unsupported embedding file format: {file_path}")
                 return None
@@ -269,19 +386,44 @@ class MatchingService:
             return None
 
         try:
-            return self.model.encode(text)
+            return self.embedding_cache.encode(self.model, [text])[0]
         except Exception as e:
             logger.error(f"Error computing embedding: {e}")
             return None
 
+    def compute_embeddings(self, texts):
+        # {name: text} -> {name: embedding}, all encoded in one batch
+        if not texts or not self.model:
+            return {}
+
+        try:
+            embeddings = self.embedding_cache.encode(self.model, list(texts.values()))
+            return dict(zip(texts, embeddings))
+        except Exception as e:
+            logger.error(f"Error computing embeddings: {e}")
+            return {}
+
     def compute_similarity(self, text1, text2):
-        if not text1 or not text2 or not self.model:
+        # Skill lists are compared as one comma-separated text; a list passed
+        # to encode() would be treated as a batch
+        if isinstance(text1, list):
+            text1 = ", ".join(text1)
+        if isinstance(text2, list):
+            text2 = ", ".join(text2)
+
+        # No forward pass for empty or identical inputs
+        if not text1 or not text2 or text1.isspace() or text2.isspace():
+            return 0.0
+        if text1 == text2:
+            return 1.0
+        if not self.model:
             return 0.0
 
         try:
-            embedding1 = self.model.encode(text1)
-            embedding2 = self.model.encode(text2)
-            return util.cos_sim(embedding1, embedding2).item()
+            embedding1, embedding2 = self.embedding_cache.encode(
+                self.model, [text1, text2]
+            )
+            return self.compute_similarity_from_embeddings(embedding1, embedding2)
         except Exception as e:
             logger.error(f"Error computing similarity: {e}")
             return 0.0
@@ -291,124 +433,208 @@ class MatchingService:
             return 0.0
 
         try:
-            return util.cos_sim(embedding1, embedding2).item()
+            # Stored embeddings are L2-normalized, so cosine is a plain dot
+            # product; the norms only correct int8/float16 rounding
+            a = np.asarray(embedding1, dtype=np.float32).ravel()
+            b = np.asarray(embedding2, dtype=np.float32).ravel()
+            norms = float(np.linalg.norm(a) * np.linalg.norm(b))
+            return float(a @ b) / norms if norms > 0 else 0.0
         except Exception as e:
             logger.error(f"Error computing similarity from embeddings: {e}")
             return 0.0
 
     def compute_exact_match_score(self, job_skills, cv_skills):
-        if not job_skills or not cv_skills:
-            return 0.0
+        return self.compute_exact_match_scores(job_skills, [cv_skills])[0]
 
-        # Convert to lowercase for case-insensitive matching
-        job_skills_lower = [skill.lower() for skill in job_skills]
-        cv_skills_lower = [skill.lower() for skill in cv_skills]
-
-        # Count matches
-        matches = sum(1 for skill in job_skills_lower if skill in cv_skills_lower)
+    def compute_exact_match_scores(self, job_skills, cv_skills_lists):
+        # Exact match score of many CVs against the same job skills: the job
+        # skills are lowercased once and each CV fills one row of a
+        # (CVs x job skills) indicator matrix
+        if not job_skills:
+            return [0.0] * len(cv_skills_lists)
 
-        # Calculate score as percentage of matched skills
-        return matches / len(job_skills) if job_skills else 0.0
+        job_skills_lower = [skill.lower() for skill in job_skills]
+        hits = np.zeros((len(cv_skills_lists), len(job_skills_lower)), dtype=bool)
+        for row, cv_skills in enumerate(cv_skills_lists):
+            if cv_skills:
+                cv_skills_lower = {skill.lower() for skill in cv_skills}
+                hits[row] = [skill in cv_skills_lower for skill in job_skills_lower]
+
+        # Percentage of job skills found in each CV
+        return (hits.sum(axis=1) / len(job_skills_lower)).tolist()
+
+    def cosine_scores(self, matrix, vector):
+        # Cosine similarity of every row of matrix with vector in one matmul
+        matrix = np.asarray(matrix, dtype=np.float32)
+        vector = np.asarray(vector, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(vector)
+        scores = matrix @ vector
+        return np.divide(scores, norms, out=np.zeros_like(scores), where=norms > 0)
 
     def compute_detailed_matching_scores(self, job_data, cv_data):
-        semantic_scores = {}
-
-        # Load CV embeddings
-        cv_file_path = os.path.join(self.CV_DATA_DIR, f"cv_{cv_data.id}.json")
-        if not os.path.exists(cv_file_path):
-            logger.error(f"CV embedding file not found: {cv_file_path}")
-            return {}
+        return self.compute_batch_matching_scores(job_data, [cv_data])[0]
 
-        with open(cv_file_path, "r") as f:
-            cv_embeddings = json.load(f)
+    def compute_batch_matching_scores(self, job_data, cv_data_list):
+        # Scores for one job against many CVs: job texts are encoded once and
+        # each comparison is one matrix-vector product over all CVs. Returns
+        # one dict per CV, {} for CVs without embeddings
+        results = [{} for _ in cv_data_list]
 
-        # Load job embedding
-        job_file_path = os.path.join(self.JOB_DATA_DIR, f"job_{job_data.job.id}.npy")
-        if not os.path.exists(job_file_path):
-            logger.error(f"Job embedding file not found: {job_file_path}")
-            return {}
+        # Load job embeddings
+        job_embeddings = self.get_job_embeddings(job_data)
+        if job_embeddings is None:
+            return results
+        job_embedding = job_embeddings["combined_text"]
+
+        # Load CV embeddings. Those stored on the row are decoded in memory;
+        # legacy CVs read files from disk, which releases the GIL, so only
+        # they are loaded concurrently
+        loaded = {}
+        file_indexes = []
+        for index, cv_data in enumerate(cv_data_list):
+            if cv_data.embedding_blob and cv_data.embedding_rows:
+                loaded[index] = self.get_cv_embeddings(cv_data)
+            else:
+                file_indexes.append(index)
+
+        workers = min(getattr(settings, "MATCHING_WORKERS", 4), len(file_indexes))
+        file_cvs = [cv_data_list[index] for index in file_indexes]
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                loaded.update(
+                    zip(file_indexes, executor.map(self.get_cv_embeddings, file_cvs))
+                )
+        else:
+            loaded.update(zip(file_indexes, map(self.get_cv_embeddings, file_cvs)))
 
-        job_embedding = np.load(job_file_path)
+        # Keep CV order, which the per-CV assembly below follows
+        cv_embeddings = {
+            index: loaded[index]
+            for index in range(len(cv_data_list))
+            if loaded[index] is not None
+        }
+        if not cv_embeddings:
+            return results
 
-        # Compare job requirements with CV skills
-        if job_data.basic_requirements and cv_embeddings["sections"].get("skills"):
-            job_req_embedding = self.compute_embedding(job_data.basic_requirements)
-            cv_skills_embedding = np.array(cv_embeddings["sections"]["skills"])
-            semantic_scores["job_requirements_cv_skills"] = (
-                self.compute_similarity_from_embeddings(
-                    job_req_embedding, cv_skills_embedding
-                )
-            )
+        # Job-side texts compared against CV sections
+        texts = {}
+        if job_data.basic_requirements:
+            texts["requirements"] = job_data.basic_requirements
+        if job_data.responsibilities:
+            texts["responsibilities"] = job_data.responsibilities
+        if job_data.job.title:
+            texts["title"] = job_data.job.title
+        if job_data.job.preferred_skills:
+            texts["preferred_skills"] = job_data.job.preferred_skills
+        if job_data.skills:
+            texts["job_skills"] = ", ".join(job_data.skills)
 
-        # Compare job requirements with CV experience
-        if job_data.basic_requirements and cv_embeddings["sections"].get("experience"):
-            job_req_embedding = self.compute_embedding(job_data.basic_requirements)
-            cv_exp_embedding = np.array(cv_embeddings["sections"]["experience"])
-            semantic_scores["job_requirements_cv_experience"] = (
-                self.compute_similarity_from_embeddings(
-                    job_req_embedding, cv_exp_embedding
+        # Job texts embedded at ingest are reused; the rest and the CV skills
+        # lists are encoded in one batch
+        stored = job_embeddings["sections"]
+        to_encode = {name: text for name, text in texts.items() if name not in stored}
+        if job_data.skills:
+            for index in cv_embeddings:
+                if cv_data_list[index].extracted_skills:
+                    to_encode[f"cv_skills_{index}"] = ", ".join(
+                        cv_data_list[index].extracted_skills
+                    )
+        embeddings = {name: stored[name] for name in texts if name in stored}
+        embeddings.update(self.compute_embeddings(to_encode))
+
+        # (score name, job text, CV section) compared section by section
+        section_pairs = [
+            ("job_requirements_cv_skills", "requirements", "skills"),
+            ("job_requirements_cv_experience", "requirements", "experience"),
+            ("job_responsibilities_cv_experience", "responsibilities", "experience"),
+            ("job_title_cv_summary", "title", "summary"),
+            ("job_preferred_cv_skills", "preferred_skills", "skills"),
+        ]
+        section_scores = {}
+        for score_name, text_name, section in section_pairs:
+            if text_name not in texts:
+                continue
+            indexes = [i for i, e in cv_embeddings.items() if section in e["sections"]]
+            if not indexes:
+                continue
+            if embeddings.get(text_name) is None:
+                scores = [0.0] * len(indexes)
+            else:
+                scores = self.cosine_scores(
+                    [cv_embeddings[i]["sections"][section] for i in indexes],
+                    embeddings[text_name],
                 )
-            )
+            section_scores[score_name] = dict(zip(indexes, scores))
 
         # Compare job skills with CV skills
-        if job_data.skills and cv_data.extracted_skills:
-            job_skills_text = ", ".join(job_data.skills)
-            cv_skills_text = ", ".join(cv_data.extracted_skills)
-            job_skills_embedding = self.compute_embedding(job_skills_text)
-            cv_skills_embedding = self.compute_embedding(cv_skills_text)
-            semantic_scores["job_skills_cv_skills"] = (
-                self.compute_similarity_from_embeddings(
-                    job_skills_embedding, cv_skills_embedding
+        skills_scores = {}
+        exact_scores = {}
+        skill_indexes = [i for i in cv_embeddings if f"cv_skills_{i}" in to_encode]
+        if skill_indexes:
+            exact_scores = dict(
+                zip(
+                    skill_indexes,
+                    self.compute_exact_match_scores(
+                        job_data.skills,
+                        [cv_data_list[i].extracted_skills for i in skill_indexes],
+                    ),
                 )
             )
-
-            # Also compute exact match score
-            exact_match = self.compute_exact_match_score(
-                job_data.skills, cv_data.extracted_skills
-            )
-            semantic_scores["exact_skills_match"] = exact_match
-
-        # Compare job responsibilities with CV experience
-        if job_data.responsibilities and cv_embeddings["sections"].get("experience"):
-            job_resp_embedding = self.compute_embedding(job_data.responsibilities)
-            cv_exp_embedding = np.array(cv_embeddings["sections"]["experience"])
-            semantic_scores["job_responsibilities_cv_experience"] = (
-                self.compute_similarity_from_embeddings(
-                    job_resp_embedding, cv_exp_embedding
+            # 0.0 when either side could not be encoded
+            skills_scores = dict.fromkeys(skill_indexes, 0.0)
+            encoded_indexes = [
+                i for i in skill_indexes if embeddings.get(f"cv_skills_{i}") is not None
+            ]
+            if embeddings.get("job_skills") is not None and encoded_indexes:
+                skills_scores.update(
+                    zip(
+                        encoded_indexes,
+                        self.cosine_scores(
+                            [embeddings[f"cv_skills_{i}"] for i in encoded_indexes],
+                            embeddings["job_skills"],
+                        ),
+                    )
                 )
-            )
 
-        # Compare job title with CV summary
-        if job_data.job.title and cv_embeddings["sections"].get("summary"):
-            job_title_embedding = self.compute_embedding(job_data.job.title)
-            cv_summary_embedding = np.array(cv_embeddings["sections"]["summary"])
-            semantic_scores["job_title_cv_summary"] = (
-                self.compute_similarity_from_embeddings(
-                    job_title_embedding, cv_summary_embedding
-                )
+        # Compare full texts
+        indexes = list(cv_embeddings)
+        combined_scores = dict(
+            zip(
+                indexes,
+                self.cosine_scores(
+                    [cv_embeddings[i]["combined_text"] for i in indexes],
+                    job_embedding,
+                ),
             )
+        )
 
-        # Compare preferred skills with CV skills
-        if job_data.job.preferred_skills and cv_embeddings["sections"].get("skills"):
-            preferred_skills_text = ", ".join(job_data.job.preferred_skills)
-            preferred_skills_embedding = self.compute_embedding(preferred_skills_text)
-            cv_skills_embedding = np.array(cv_embeddings["sections"]["skills"])
-            semantic_scores["job_preferred_cv_skills"] = (
-                self.compute_similarity_from_embeddings(
-                    preferred_skills_embedding, cv_skills_embedding
-                )
-            )
+        # Assemble per-CV scores in the same order as the weights
+        for index in cv_embeddings:
+            cv_data = cv_data_list[index]
+            semantic_scores = results[index]
+            for score_name, _, _ in section_pairs[:2]:
+                scores = section_scores.get(score_name, {})
+                if index in scores:
+                    semantic_scores[score_name] = float(scores[index])
 
-        # Compare full texts
-        semantic_scores["combined_text"] = self.compute_similarity_from_embeddings(
-            job_embedding, np.array(cv_embeddings["combined_text"])
-        )
+            if index in skills_scores:
+                semantic_scores["job_skills_cv_skills"] = float(skills_scores[index])
+
+                # Also add exact match score
+                semantic_scores["exact_skills_match"] = exact_scores[index]
 
-        # Add context-aware matching score
-        context_score = self.match_with_context(job_data, cv_data)
-        semantic_scores["context_match"] = context_score
+            for score_name, _, _ in section_pairs[2:]:
+                scores = section_scores.get(score_name, {})
+                if index in scores:
+                    semantic_scores[score_name] = float(scores[index])
 
-        return semantic_scores
+            semantic_scores["combined_text"] = float(combined_scores[index])
+
+            # Add context-aware matching score
+            context_score = self.match_with_context(job_data, cv_data)
+            semantic_scores["context_match"] = context_score
+
+        return results
 
     def compute_weighted_score(self, detailed_scores):
         if not detailed_scores:
@@ -440,22 +666,62 @@ class MatchingService:
 
         return weighted_score
 
+    def build_match_values(self, job_data, cv_data, detailed_scores):
+        # Field values of the JobCVMatch record for one scored CV
+        # Compute overall match score
+        match_score = self.compute_weighted_score(detailed_scores)
+
+        # Generate match explanation
+        match_explanation = self.generate_match_explanation(
+            job_data, cv_data, detailed_scores
+        )
+
+        return {
+            "cv_processed_data": cv_data,
+            "match_score": match_score,
+            "match_details": {
+                "overall_score": match_score,
+                "detail_scores": detailed_scores,
+                "explanation": match_explanation,
+            },
+        }
+
+    def save_match(self, job_data, cv_data, detailed_scores):
+        # Create or update match record
+        job_cv_match, created = JobCVMatch.objects.update_or_create(
+            job_id=job_data.job_id,
+            application_id=cv_data.application_id,
+            defaults=self.build_match_values(job_data, cv_data, detailed_scores),
+        )
+
+        return job_cv_match
+
     def match_job_cv(self, job_id, application_id=None, cv_id=None):
         try:
             # Get job data
-            job_data = JobProcessedData.objects.filter(job_id=job_id).first()
+            job_data = (
+                JobProcessedData.objects.select_related("job")
+                .filter(job_id=job_id)
+                .first()
+            )
             if not job_data:
                 logger.error(f"No processed data found for job {job_id}")
                 return None
 
-            # Get CV data based on application_id or cv_id
+            # Get CV data based on application_id or cv_id (CVProcessedData id)
             cv_data = None
             if application_id:
-                application = JobApplication.objects.filter(id=application_id).first()
-                if application and application.cv:
-                    cv_data = CVProcessedData.objects.filter(cv=application.cv).first()
+                cv_data = (
+                    CVProcessedData.objects.only(*_MATCH_CV_FIELDS)
+                    .filter(application_id=application_id)
+                    .first()
+                )
             elif cv_id:
-                cv_data = CVProcessedData.objects.filter(cv_id=cv_id).first()
+                cv_data = (
+                    CVProcessedData.objects.only(*_MATCH_CV_FIELDS)
+                    .filter(id=cv_id)
+                    .first()
+                )
 
             if not cv_data:
                 logger.error(
@@ -469,29 +735,7 @@ class MatchingService:
                 logger.error("Failed to compute detailed matching scores")
                 return None
 
-            # Compute overall match score
-            match_score = self.compute_weighted_score(detailed_scores)
-
-            # Generate match explanation
-            match_explanation = self.generate_match_explanation(
-                job_data, cv_data, detailed_scores
-            )
-
-            # Create or update match record
-            job_cv_match, created = JobCVMatch.objects.update_or_create(
-                job_id=job_id,
-                cv_id=cv_data.cv.id if cv_data.cv else None,
-                defaults={
-                    "match_score": match_score,
-                    "match_details": {
-                        "overall_score": match_score,
-                        "detail_scores": detailed_scores,
-                        "explanation": match_explanation,
-                    },
-                },
-            )
-
-            return job_cv_match
+            return self.save_match(job_data, cv_data, detailed_scores)
         except Exception as e:
             logger.error(f"Error in match_job_cv: {e}")
             logger.error(traceback.format_exc())
@@ -499,26 +743,70 @@ class MatchingService:
 
     def match_job_with_all_applications(self, job_id):
         try:
-            # Get job
-            job = Job.objects.filter(id=job_id).first()
-            if not job:
-                logger.error(f"Job not found: {job_id}")
+            # Get job data
+            job_data = (
+                JobProcessedData.objects.select_related("job")
+                .filter(job_id=job_id)
+                .first()
+            )
+            if not job_data:
+                logger.error(f"No processed data found for job {job_id}")
                 return []
 
-            # Get all applications for this job
-            applications = JobApplication.objects.filter(job=job)
+            # Processed CVs of all applications for this job
+            cv_data_list = list(
+                CVProcessedData.objects.only(*_MATCH_CV_FIELDS).filter(
+                    application__job_id=job_id
+                )
+            )
+
+            # Score every CV in one pass so the job side is encoded only once
+            all_scores = self.compute_batch_matching_scores(job_data, cv_data_list)
 
-            results = []
-            for application in applications:
-                if application.cv:
-                    match_result = self.match_job_cv(
-                        job_id, application_id=application.id
+            matches = []
+            for cv_data, detailed_scores in zip(cv_data_list, all_scores):
+                if not detailed_scores:
+                    logger.error(
+                        f"Failed to compute detailed matching scores for CV {cv_data.id}"
                     )
-                    if match_result:
-                        results.append(match_result)
+                    continue
+                matches.append(
+                    JobCVMatch(
+                        job_id=job_data.job_id,
+                        application_id=cv_data.application_id,
+                        **self.build_match_values(job_data, cv_data, detailed_scores),
+                    )
+                )
 
-            return results
+            # Write every match record in one
+            # INSERT ... ON CONFLICT (job_id, application_id) DO UPDATE
+            JobCVMatch.objects.bulk_create(
+                matches,
+                update_conflicts=True,
+                unique_fields=["job", "application"],
+                update_fields=[
+                    "cv_processed_data",
+                    "match_score",
+                    "match_details",
+                    "updated_at",
+                ],
+            )
+
+            # Updated rows keep their stored id, not the uuid4 of the objects
+            # passed to bulk_create, so return the rows as stored
+            return list(
+                JobCVMatch.objects.filter(
+                    job_id=job_data.job_id,
+                    application_id__in=[match.application_id for match in matches],
+                )
+            )
         except Exception as e:
             logger.error(f"Error in match_job_with_all_applications: {e}")
             logger.error(traceback.format_exc())
             return []
+
+
+@lru_cache(maxsize=1)
+def get_matching_service():
+    # Shared service so the SBERT model and skills list are loaded once
+    return MatchingService()
@@ -0,0 +1,23 @@
+# Generated by Django 5.2 on 2026-10-16 10:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('AI', '0009_jobcvmatch_match_details'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cvprocesseddata',
+            name='embedding_blob',
+            field=models.BinaryField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='cvprocesseddata',
+            name='embedding_rows',
+            field=models.JSONField(blank=True, default=list),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-16 10:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('AI', '0010_cvprocesseddata_embedding_blob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cvprocesseddata',
+            name='content_hash',
+            field=models.CharField(blank=True, db_index=True, max_length=32),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-16 11:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('AI', '0011_cvprocesseddata_content_hash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobprocesseddata',
+            name='embedding_blob',
+            field=models.BinaryField(blank=True, null=True),
+        ),
+    ]
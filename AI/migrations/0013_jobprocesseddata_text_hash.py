@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-16 11:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('AI', '0012_jobprocesseddata_embedding_blob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobprocesseddata',
+            name='text_hash',
+            field=models.CharField(blank=True, max_length=32),
+        ),
+    ]
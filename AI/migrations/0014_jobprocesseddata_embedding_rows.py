@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-16 13:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('AI', '0013_jobprocesseddata_text_hash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobprocesseddata',
+            name='embedding_rows',
+            field=models.JSONField(blank=True, default=list),
+        ),
+    ]
@@ -0,0 +1,50 @@
+from functools import lru_cache
+import torch
+from django.conf import settings
+from sentence_transformers import SentenceTransformer
+
+
+def sbert_device():
+    # Explicit device from settings, else the GPU whenever one is available
+    device = getattr(settings, "SBERT_DEVICE", None)
+    if not device:
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+    return device
+
+
+def model_signature(model_name="all-MiniLM-L6-v2"):
+    # Identifies the numeric path producing embeddings (model, backend, ONNX
+    # file, device type and precision), so results computed on one path are
+    # never served for another
+    if getattr(settings, "SBERT_BACKEND", "torch") == "onnx":
+        onnx_file = getattr(settings, "SBERT_ONNX_FILE", None) or ""
+        return f"{model_name}|onnx|{onnx_file}|cpu|fp32"
+
+    if sbert_device().startswith("cuda"):
+        return f"{model_name}|torch|cuda|fp16"
+    return f"{model_name}|torch|cpu|fp32"
+
+
+@lru_cache(maxsize=4)
+def get_sentence_transformer(model_name="all-MiniLM-L6-v2"):
+    # Load each SBERT model once per process; loading the weights from disk
+    # takes seconds, so every processor instance shares the same object
+    if getattr(settings, "SBERT_BACKEND", "torch") == "onnx":
+        # ONNX Runtime fuses the attention/MatMul graph on CPU
+        model_kwargs = {"provider": "CPUExecutionProvider"}
+        onnx_file = getattr(settings, "SBERT_ONNX_FILE", None)
+        if onnx_file:
+            model_kwargs["file_name"] = onnx_file
+        return SentenceTransformer(
+            model_name, device="cpu", backend="onnx", model_kwargs=model_kwargs
+        )
+
+    device = sbert_device()
+    model = SentenceTransformer(model_name, device=device)
+
+    # fp16 on GPU runs on tensor cores; embeddings are normalized afterwards,
+    # so the lost precision does not matter for cosine similarity
+    if device.startswith("cuda"):
+        model.half()
+
+    return model
@@ -53,6 +53,14 @@ class JobProcessedData(models.Model):
     # Đường dẫn đến file lưu vector embedding
     embedding_file = models.CharField(max_length=255, blank=True)
 
+    # Ma trận embedding (lượng tử hóa int8) lưu trực tiếp trong bảng và tên
+    # từng dòng (combined, requirements, responsibilities, title, ...)
+    embedding_blob = models.BinaryField(blank=True, null=True)
+    embedding_rows = models.JSONField(blank=True, default=list)
+
+    # Mã băm của combined_text, dùng để bỏ qua việc encode lại job không đổi
+    text_hash = models.CharField(max_length=32, blank=True)
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -97,6 +105,13 @@ class CVProcessedData(models.Model):
     # Đường dẫn đến file lưu vector embedding
     embedding_file = models.CharField(max_length=255, blank=True)
 
+    # Ma trận embedding (float16) lưu trực tiếp trong bảng và tên từng dòng
+    embedding_blob = models.BinaryField(blank=True, null=True)
+    embedding_rows = models.JSONField(blank=True, default=list)
+
+    # Mã băm nội dung file CV, dùng để tái sử dụng kết quả cho file trùng lặp
+    content_hash = models.CharField(max_length=32, blank=True, db_index=True)
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -1,7 +1,18 @@
 from celery import shared_task
-from .cv_processing import process_cv_on_application
-from .job_processing import process_job_on_publish, process_job_on_update
-from .matching_service import MatchingService
+from celery.signals import worker_process_init
+from .cv_processing import (
+    get_cv_processor,
+    get_nlp,
+    process_cv_batch,
+    process_cv_on_application,
+)
+from .job_processing import (
+    get_job_processor,
+    process_job_on_publish,
+    process_job_on_update,
+    process_jobs,
+)
+from .matching_service import get_matching_service
 from application.models import JobApplication
 from jobs.models import Job
 import logging
@@ -9,14 +20,31 @@ import logging
 logger = logging.getLogger(__name__)
 
 
-@shared_task
-def process_cv_task(application_id):
+@worker_process_init.connect
+def preload_processors(**kwargs):
+    """
+    Nạp sẵn CVProcessor, JobProcessor, MatchingService (model SBERT, danh sách
+    kỹ năng) và pipeline spaCy khi worker khởi động để các task không phải chờ
+    tải model
+    """
+    try:
+        get_cv_processor()
+        get_job_processor()
+        get_matching_service()
+        get_nlp()
+    except Exception as e:
+        logger.error(f"Error preloading processors: {e}")
+
+
+@shared_task(bind=True, acks_late=True)
+def process_cv_task(self, application_id, force=False):
     """
-    Task xử lý CV bất đồng bộ
+    Task xử lý CV bất đồng bộ; force=True xử lý lại CV kể cả khi đã có kết quả
+    cho cùng nội dung file
     """
     try:
         application = JobApplication.objects.get(id=application_id)
-        result = process_cv_on_application(application)
+        result = process_cv_on_application(application, force=force)
         logger.info(f"Successfully processed CV for application {application_id}")
         return result
     except Exception as e:
@@ -30,7 +58,7 @@ def process_job_task(job_id, action="update"):
     Task xử lý job bất đồng bộ
     """
     try:
-        job = Job.objects.get(id=job_id)
+        job = Job.objects.prefetch_related("skills").get(id=job_id)
         if action == "publish":
             result = process_job_on_publish(job)
         else:
@@ -40,3 +68,35 @@ def process_job_task(job_id, action="update"):
     except Exception as e:
         logger.error(f"Error processing job: {e}")
         return None
+
+
+@shared_task
+def process_jobs_task(job_ids, batch_size=64):
+    """
+    Task xử lý lại nhiều job cùng lúc: văn bản của cả lô được encode trong một
+    lần gọi model, job có nội dung không đổi giữ nguyên embedding đã lưu
+    """
+    try:
+        jobs = Job.objects.filter(id__in=job_ids)
+        results = process_jobs(jobs, batch_size=batch_size)
+        logger.info(f"Successfully processed {len(results)} jobs")
+        return len(results)
+    except Exception as e:
+        logger.error(f"Error processing jobs: {e}")
+        return 0
+
+
+@shared_task(acks_late=True)
+def process_cvs_task(application_ids, force=False, batch_size=64):
+    """
+    Task xử lý nhiều CV cùng lúc: văn bản của cả lô được encode trong một lần
+    gọi model và lưu bằng một câu lệnh upsert
+    """
+    try:
+        applications = JobApplication.objects.filter(id__in=application_ids)
+        results = process_cv_batch(applications, batch_size=batch_size, force=force)
+        logger.info(f"Successfully processed {len(results)} CVs")
+        return len(results)
+    except Exception as e:
+        logger.error(f"Error processing CVs: {e}")
+        return 0
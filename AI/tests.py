@@ -1,3 +1,310 @@
-from django.test import TestCase
+import os
+import re
+import tempfile
+from unittest import mock
 
-# Create your tests here.
+import numpy as np
+from django.test import SimpleTestCase, override_settings
+
+from . import text_utils
+from .embedding_cache import EmbeddingCache
+from .embeddings import dequantize_embedding, quantize_embedding
+from .text_utils import SkillCoverage, SkillMatcher, advanced_preprocessing
+
+# Skills whose names overlap or end in non-word characters, where word
+# boundaries are easy to get wrong
+SKILLS = [
+    "c",
+    "c++",
+    "c#",
+    "java",
+    "javascript",
+    "react",
+    "react native",
+    "node",
+    "sql",
+    "mysql",
+    ".net",
+    "asp.net",
+    "go",
+    "machine learning",
+]
+
+TEXTS = [
+    "",
+    "c",
+    "experienced in c++ and c, java but not javascript",
+    "javascript only",
+    "react native developer who also uses react",
+    "mysql and sql server",
+    "asp.net core and .net framework",
+    "golang, go and go-kit",
+    "c#/.net developer",
+    "machine learning with python",
+    "c++c#java",
+]
+
+
+def find_with_regex(skills, text):
+    # Reference: the per-skill \bskill\b search SkillMatcher replaces
+    return {
+        skill for skill in skills if re.search(r"\b" + re.escape(skill) + r"\b", text)
+    }
+
+
+def find_overlapping_by_scan(skills, name):
+    # Reference: the list scan find_overlapping replaces
+    if name in skills:
+        return name
+    for skill in skills:
+        if name in skill or skill in name:
+            return skill
+    return None
+
+
+def make_matchers(skills):
+    # The matcher on every backend available here: the automaton when
+    # pyahocorasick is installed, and always the regex fallback
+    matchers = []
+    if text_utils.ahocorasick is not None:
+        matchers.append(("automaton", SkillMatcher(skills)))
+    with mock.patch.object(text_utils, "ahocorasick", None):
+        matchers.append(("regex", SkillMatcher(skills)))
+    return matchers
+
+
+class SkillMatcherTests(SimpleTestCase):
+    def test_backends(self):
+        for backend, matcher in make_matchers(SKILLS):
+            with self.subTest(backend=backend):
+                self.assertEqual(matcher.automaton is not None, backend == "automaton")
+
+    def test_find_matches_per_skill_regex(self):
+        for backend, matcher in make_matchers(SKILLS):
+            for text in TEXTS:
+                with self.subTest(backend=backend, text=text):
+                    self.assertEqual(matcher.find(text), find_with_regex(SKILLS, text))
+
+    def test_find_respects_word_boundaries(self):
+        for backend, matcher in make_matchers(SKILLS):
+            with self.subTest(backend=backend):
+                self.assertNotIn("java", matcher.find("javascript only"))
+                self.assertIn("javascript", matcher.find("javascript only"))
+                # \b after "++" needs a word character, as with the old regex
+                self.assertNotIn("c++", matcher.find("c++ developer"))
+                self.assertIn("c", matcher.find("c++ developer"))
+
+    def test_find_overlapping_matches_list_scan(self):
+        names = [
+            "",
+            "c",
+            "react",
+            "reactjs",
+            "native",
+            "script",
+            "my",
+            "python",
+            "asp.net mvc",
+        ]
+        for backend, matcher in make_matchers(SKILLS):
+            for name in names:
+                with self.subTest(backend=backend, name=name):
+                    self.assertEqual(
+                        matcher.find_overlapping(name),
+                        find_overlapping_by_scan(SKILLS, name),
+                    )
+
+    def test_find_substrings_in_list_order(self):
+        for backend, matcher in make_matchers(SKILLS):
+            with self.subTest(backend=backend):
+                self.assertEqual(
+                    matcher.find_substrings("mysql"),
+                    [skill for skill in SKILLS if skill in "mysql"],
+                )
+
+
+class AdvancedPreprocessingTests(SimpleTestCase):
+    def test_expands_abbreviations(self):
+        self.assertEqual(
+            advanced_preprocessing("js and py for ml"),
+            "javascript and python for machine learning",
+        )
+
+    def test_abbreviations_are_whole_words(self):
+        self.assertEqual(advanced_preprocessing("json jsx"), "json jsx")
+
+    def test_longest_abbreviation_wins(self):
+        self.assertEqual(
+            advanced_preprocessing("ui/ux designer"),
+            "user interface and user experience designer",
+        )
+
+    def test_normalizes_technology_variants(self):
+        self.assertEqual(
+            advanced_preprocessing("reactjs, nodejs and postgres on kubernetes"),
+            "react, node and postgresql on k8s",
+        )
+
+    def test_variant_inside_word_is_not_an_abbreviation(self):
+        self.assertEqual(advanced_preprocessing("mysql and ms sql"), "mysql and mssql")
+
+    def test_empty_text(self):
+        self.assertEqual(advanced_preprocessing(""), "")
+        self.assertEqual(advanced_preprocessing("  \n "), "")
+
+
+class QuantizeEmbeddingTests(SimpleTestCase):
+    def test_round_trip(self):
+        rng = np.random.default_rng(0)
+        embedding = rng.standard_normal(384).astype(np.float32)
+        embedding /= np.linalg.norm(embedding)
+
+        data = quantize_embedding(embedding)
+        restored = dequantize_embedding(data)
+
+        self.assertEqual(len(data), 384)
+        self.assertEqual(restored.dtype, np.float32)
+        self.assertLessEqual(np.abs(restored - embedding).max(), 0.5 / 127 + 1e-6)
+
+    def test_cosine_is_preserved(self):
+        rng = np.random.default_rng(1)
+        matrix = rng.standard_normal((2, 384)).astype(np.float32)
+        matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+
+        restored = dequantize_embedding(quantize_embedding(matrix)).reshape(2, -1)
+        restored /= np.linalg.norm(restored, axis=1, keepdims=True)
+
+        self.assertAlmostEqual(
+            float(restored[0] @ restored[1]), float(matrix[0] @ matrix[1]), delta=0.01
+        )
+        self.assertGreater(float(restored[0] @ matrix[0]), 0.99)
+
+
+class FakeModel:
+    # Stands in for SentenceTransformer: a fixed unit vector per text
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, texts, **kwargs):
+        self.calls.append(list(texts))
+        rows = []
+        for text in texts:
+            rng = np.random.default_rng(len(text) + sum(map(ord, text)))
+            row = rng.standard_normal(8).astype(np.float32)
+            rows.append(row / np.linalg.norm(row))
+        return np.array(rows)
+
+
+@override_settings(SBERT_BACKEND="torch", SBERT_DEVICE="cpu")
+class EmbeddingCacheTests(SimpleTestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.model = FakeModel()
+
+    def make_cache(self, **kwargs):
+        kwargs.setdefault("max_files", 100)
+        return EmbeddingCache("test-model", cache_dir=self.tmp.name, **kwargs)
+
+    def cached_files(self):
+        return [
+            name
+            for _, _, names in os.walk(self.tmp.name)
+            for name in names
+            if name.endswith(".npy")
+        ]
+
+    def test_miss_then_memory_hit(self):
+        cache = self.make_cache()
+        first = cache.encode(self.model, ["python", "django"])
+        second = cache.encode(self.model, ["django", "python"])
+
+        self.assertEqual(self.model.calls, [["python", "django"]])
+        np.testing.assert_array_equal(second, first[::-1])
+
+    def test_disk_hit_from_new_instance(self):
+        first = self.make_cache().encode(self.model, ["python"])
+        second = self.make_cache().encode(self.model, ["python"])
+
+        self.assertEqual(len(self.model.calls), 1)
+        self.assertEqual(second.dtype, np.float32)
+        np.testing.assert_allclose(second, first, atol=1e-3)
+
+    def test_only_missing_texts_are_encoded_once(self):
+        cache = self.make_cache()
+        cache.encode(self.model, ["python"])
+        result = cache.encode(self.model, ["python", "go", "go"])
+
+        self.assertEqual(self.model.calls, [["python"], ["go"]])
+        self.assertEqual(result.shape, (3, 8))
+        np.testing.assert_array_equal(result[1], result[2])
+
+    def test_invalidate(self):
+        cache = self.make_cache()
+        cache.encode(self.model, ["python"])
+        self.assertEqual(len(self.cached_files()), 1)
+
+        cache.invalidate("python")
+        self.assertEqual(self.cached_files(), [])
+
+        cache.encode(self.model, ["python"])
+        self.assertEqual(len(self.model.calls), 2)
+
+        # Unknown texts are ignored
+        cache.invalidate("unknown")
+
+    def test_disk_layer_is_capped(self):
+        cache = self.make_cache(max_files=3)
+        cache.encode(self.model, [f"skill {index}" for index in range(10)])
+        cache.prune()
+
+        self.assertLessEqual(len(self.cached_files()), 3)
+
+    def test_key_depends_on_backend(self):
+        torch_key = self.make_cache()._key("python")
+        with override_settings(SBERT_BACKEND="onnx"):
+            onnx_key = self.make_cache()._key("python")
+
+        self.assertNotEqual(torch_key, onnx_key)
+
+
+def covered_by_scan(skills, names):
+    # Reference: the nested substring loop SkillCoverage replaces
+    return {
+        skill
+        for skill in skills
+        if skill and any(skill in name or name in skill for name in names)
+    }
+
+
+class SkillCoverageTests(SimpleTestCase):
+    def test_matches_nested_substring_loop(self):
+        job_skills = ["python", "react", "react native", "sql", "c", "go"]
+        cases = [
+            [],
+            [""],
+            ["python"],
+            ["python 3", "reactjs"],
+            ["native"],
+            ["mysql", "golang"],
+            ["c++", "c#"],
+            ["", "java"],
+        ]
+        for names in cases:
+            with self.subTest(names=names):
+                self.assertEqual(
+                    SkillCoverage(job_skills).covered(names),
+                    covered_by_scan(job_skills, names),
+                )
+
+    def test_regex_fallback_matches_nested_substring_loop(self):
+        job_skills = ["python", "react native", "sql"]
+        names = ["mysql", "react", "python developer", ""]
+        with mock.patch.object(text_utils, "ahocorasick", None):
+            coverage = SkillCoverage(job_skills)
+        self.assertIsNone(coverage.automaton)
+        self.assertEqual(coverage.covered(names), covered_by_scan(job_skills, names))
+
+    def test_names_do_not_match_across_each_other(self):
+        # "xreac" and "tx" run together would contain "react"
+        self.assertEqual(SkillCoverage(["react"]).covered(["xreac", "tx"]), set())
@@ -0,0 +1,321 @@
+import os
+import re
+import logging
+from functools import lru_cache
+from django.conf import settings
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+logger = logging.getLogger(__name__)
+
+IT_SKILLS_FILE = os.path.join(settings.BASE_DIR, "AI", "it_skills.txt")
+
+
+@lru_cache(maxsize=1)
+def load_it_skills():
+    # The IT skills list is read from disk once per process and shared by the
+    # CV, job and matching processors
+    try:
+        with open(IT_SKILLS_FILE, "r") as f:
+            return tuple(line.strip().lower() for line in f)
+    except Exception as e:
+        logger.error(f"Error loading IT skills list: {e}")
+        return ()
+
+
+def _is_word_char(char):
+    # Same definition as \w in Python's re for str patterns
+    return char.isalnum() or char == "_"
+
+
+def _at_word_boundary(text, index):
+    # Equivalent of a \b assertion at position index of text
+    before = index > 0 and _is_word_char(text[index - 1])
+    after = index < len(text) and _is_word_char(text[index])
+    return before != after
+
+
+def _contains_skill(skill, other):
+    # True if other occurs inside skill on word boundaries; the edges of skill
+    # already sit on boundaries whenever skill itself matched
+    start = skill.find(other)
+    while start != -1:
+        end = start + len(other)
+        if (start == 0 or _at_word_boundary(skill, start)) and (
+            end == len(skill) or _at_word_boundary(skill, end)
+        ):
+            return True
+        start = skill.find(other, start + 1)
+    return False
+
+
+class SkillMatcher:
+    """
+    Finds every known skill in a lowercase text in one pass: an Aho-Corasick
+    automaton when pyahocorasick is installed, one regex alternation otherwise.
+    Matches are the same as searching each skill with \\bskill\\b
+    """
+
+    def __init__(self, skills):
+        self.skills = tuple(skills)
+
+        # Position of each skill in the list, for ordering matches
+        self.order = {}
+        for index, skill in enumerate(self.skills):
+            self.order.setdefault(skill, index)
+
+        # Aho-Corasick automaton matching every skill in one pass over the text
+        self.automaton = None
+        if ahocorasick is not None and self.skills:
+            automaton = ahocorasick.Automaton()
+            for skill in self.order:
+                automaton.add_word(skill, skill)
+            automaton.make_automaton()
+            self.automaton = automaton
+
+        # Fallback without pyahocorasick: one alternation scanned once. The
+        # lookahead lets matches overlap and longer skills are tried first
+        self.skills_re = None
+        self.contained_skills = {}
+        if self.automaton is None and self.skills:
+            skills_by_length = sorted(self.order, key=len, reverse=True)
+            self.skills_re = re.compile(
+                r"(?=\b("
+                + "|".join(re.escape(skill) for skill in skills_by_length)
+                + r")\b)"
+            )
+            # Shorter skills hidden inside a longer match at the same
+            # position, e.g. "react" inside "react native"
+            self.contained_skills = {
+                skill: [
+                    other
+                    for other in self.order
+                    if other != skill and _contains_skill(skill, other)
+                ]
+                for skill in self.order
+            }
+
+        # Memoized per captured name: the same names recur across documents
+        self.find_overlapping = lru_cache(maxsize=4096)(self._find_overlapping)
+
+    def _find_overlapping(self, name):
+        # The known skill for a captured name: the name itself when it is a
+        # skill, else the first skill in list order that contains the name or
+        # occurs inside it, else None
+        if name in self.order:
+            return name
+
+        # Skills occurring inside the name come from one automaton pass, so
+        # only the list prefix before the first of them needs a scan
+        inside = self.find_substrings(name)
+        limit = self.order[inside[0]] if inside else len(self.skills)
+        for skill in self.skills[:limit]:
+            if name in skill:
+                return skill
+
+        return inside[0] if inside else None
+
+    def find(self, text):
+        # Set of skills occurring in text on word boundaries
+        found_skills = set()
+        if self.automaton is not None:
+            for end_index, skill in self.automaton.iter(text):
+                start_index = end_index - len(skill) + 1
+                if _at_word_boundary(text, start_index) and _at_word_boundary(
+                    text, end_index + 1
+                ):
+                    found_skills.add(skill)
+        elif self.skills_re is not None:
+            for match in self.skills_re.finditer(text):
+                skill = match.group(1)
+                if skill not in found_skills:
+                    found_skills.add(skill)
+                    found_skills.update(self.contained_skills[skill])
+        return found_skills
+
+    def find_substrings(self, text):
+        # Skills occurring anywhere in text (plain substring match, no word
+        # boundaries), in list order
+        if self.automaton is not None:
+            found = {skill for _, skill in self.automaton.iter(text)}
+            return sorted(found, key=self.order.__getitem__)
+        return [skill for skill in self.order if skill in text]
+
+
+@lru_cache(maxsize=1)
+def get_skill_matcher():
+    # Built once per process from the shared IT skills list
+    return SkillMatcher(load_it_skills())
+
+
+class SkillCoverage:
+    """
+    Which skills of a fixed list overlap a set of other skill names, where
+    overlap means one name contains the other. Built once per job skill list
+    and reused for every CV, so each check is one automaton pass plus one
+    dict lookup per name instead of comparing every pair of names
+    """
+
+    def __init__(self, skills):
+        self.skills = tuple(dict.fromkeys(skill for skill in skills if skill))
+
+        # Skills occurring inside a name, found in one pass over the names
+        self.automaton = None
+        if ahocorasick is not None and self.skills:
+            automaton = ahocorasick.Automaton()
+            for skill in self.skills:
+                automaton.add_word(skill, skill)
+            automaton.make_automaton()
+            self.automaton = automaton
+
+        # Names occurring inside a skill: every substring of every skill maps
+        # to the skills containing it
+        self.containing = {}
+        for skill in self.skills:
+            for start in range(len(skill) + 1):
+                for end in range(start, len(skill) + 1):
+                    self.containing.setdefault(skill[start:end], set()).add(skill)
+
+    def covered(self, names):
+        # Skills that contain, or occur inside, at least one of names
+        found = set()
+        for name in names:
+            found.update(self.containing.get(name, ()))
+
+        # Newlines keep matches from spanning two names
+        text = "\n".join(names)
+        if self.automaton is not None:
+            found.update(skill for _, skill in self.automaton.iter(text))
+        elif names:
+            found.update(skill for skill in self.skills if skill in text)
+        return found
+
+
+# Precompiled text normalization patterns
+_HTML_RE = re.compile(r"<.*?>")
+_DOT_RE = re.compile(r"\.(?=[A-Za-z])")
+
+
+# Memoized: the same section text is cleaned again when skills are extracted,
+# and identical boilerplate shows up across CVs and job posts
+@lru_cache(maxsize=1024)
+def clean_text(text):
+    # Empty and whitespace-only sections (e.g. a blank preferred_skills)
+    # return before any regex runs
+    if not text or text.isspace():
+        return ""
+
+    # Remove HTML tags
+    text = _HTML_RE.sub(" ", text)
+
+    # Normalize punctuation
+    text = _DOT_RE.sub(". ", text)
+
+    # Collapse line breaks and extra whitespace
+    return " ".join(text.split())
+
+
+# IT abbreviations and technology name variants for normalization
+ABBREVIATIONS = {
+    "js": "javascript",
+    "ts": "typescript",
+    "py": "python",
+    "ml": "machine learning",
+    "ai": "artificial intelligence",
+    "ui": "user interface",
+    "ux": "user experience",
+    "fe": "frontend",
+    "be": "backend",
+    "fs": "fullstack",
+    "api": "application programming interface",
+    "sql": "structured query language",
+    "nosql": "non-relational database",
+    "ci": "continuous integration",
+    "cd": "continuous deployment",
+    "db": "database",
+    "ide": "integrated development environment",
+    "oop": "object-oriented programming",
+    "fp": "functional programming",
+    "qa": "quality assurance",
+    "sdk": "software development kit",
+    "ros": "robot operating system",
+    "os": "operating system",
+    "ui/ux": "user interface and user experience",
+}
+
+TECH_VARIANTS = {
+    r"react\.?js": "react",
+    r"node\.?js": "node",
+    r"angular(?:js)?(?:\s*[0-9.]+)?": "angular",
+    r"vue\.?js": "vue",
+    r"express\.?js": "express",
+    r"next\.?js": "nextjs",
+    r"mongo\s*db": "mongodb",
+    r"postgre(?:s|sql)": "postgresql",
+    r"ms\s*sql": "mssql",
+    r"my\s*sql": "mysql",
+    r"type\s*script": "typescript",
+    r"java\s*script": "javascript",
+    r"dotnet": ".net",
+    r"asp\.net(?:\s*core)?": "asp.net",
+    r"laravel\s*[0-9.]*": "laravel",
+    r"spring\s*boot": "spring boot",
+    r"spring\s*framework": "spring",
+    r"django\s*[0-9.]*": "django",
+    r"flask\s*[0-9.]*": "flask",
+    r"ruby\s*on\s*rails": "ruby on rails",
+    r"tensorflow\s*[0-9.]*": "tensorflow",
+    r"pytorch\s*[0-9.]*": "pytorch",
+    r"kubernetes": "k8s",
+    r"docker\s*compose": "docker-compose",
+    r"github\s*actions": "github actions",
+    r"gitlab\s*ci": "gitlab ci",
+    r"jenkins\s*[0-9.]*": "jenkins",
+}
+
+# Abbreviations and technology variants fused into one alternation so the text
+# is scanned once. Abbreviations are whole words sharing a single group (longest
+# first) and are expanded by dict lookup; each technology variant is a named
+# group whose match is replaced through _TERM_REPLACEMENTS
+_ABBREVIATION_PATTERN = (
+    r"(?P<abbr>\b(?:"
+    + "|".join(
+        re.escape(abbreviation)
+        for abbreviation in sorted(ABBREVIATIONS, key=len, reverse=True)
+    )
+    + r")\b)"
+)
+_TERM_RE = re.compile(
+    "|".join(
+        [_ABBREVIATION_PATTERN]
+        + [f"(?P<t{i}>{pattern})" for i, pattern in enumerate(TECH_VARIANTS)]
+    ),
+    re.IGNORECASE,
+)
+_TERM_REPLACEMENTS = {
+    f"t{i}": replacement for i, replacement in enumerate(TECH_VARIANTS.values())
+}
+
+
+def _replace_term(match):
+    if match.lastgroup == "abbr":
+        return ABBREVIATIONS[match.group().lower()]
+    return _TERM_REPLACEMENTS[match.lastgroup]
+
+
+# Memoized like clean_text
+@lru_cache(maxsize=1024)
+def advanced_preprocessing(text, cleaned=False):
+    if not text or text.isspace():
+        return ""
+
+    # Basic cleaning, skipped when the caller passes clean_text output
+    # (cleaning is idempotent, so running it again would only rescan the text)
+    if not cleaned:
+        text = clean_text(text)
+
+    # Expand IT abbreviations and normalize technology names in one pass
+    return _TERM_RE.sub(_replace_term, text)
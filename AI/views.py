@@ -239,9 +239,9 @@ class MatchJobWithCVView(APIView):
                 )
 
             # Thực hiện đánh giá độ phù hợp đồng bộ
-            from .matching_service import MatchingService
+            from .matching_service import get_matching_service
 
-            matching_service = MatchingService()
+            matching_service = get_matching_service()
             match_result = matching_service.match_job_cv(
                 str(job_id), application_id=str(application_id)
             )
@@ -350,7 +350,7 @@ class MatchJobWithAllCVsView(APIView):
                 )
 
             # Xử lý CV bất đồng bộ nếu cần
-            from .tasks import process_cv_task
+            from .tasks import process_cvs_task
 
             applications_need_processing = []
             for application in applications:
@@ -361,10 +361,12 @@ class MatchJobWithAllCVsView(APIView):
                     # Nếu CV chưa được xử lý, thêm vào danh sách cần xử lý
                     applications_need_processing.append(application)
 
-            # Nếu có application cần xử lý CV, gửi task và trả về thông báo
+            # Nếu có application cần xử lý CV, gửi một task xử lý cả lô và trả
+            # về thông báo
             if applications_need_processing:
-                for app in applications_need_processing:
-                    process_cv_task.delay(str(app.id))
+                process_cvs_task.delay(
+                    [str(app.id) for app in applications_need_processing]
+                )
 
                 return Response(
                     {
@@ -379,18 +381,13 @@ class MatchJobWithAllCVsView(APIView):
                 )
 
             # Nếu tất cả CV đã được xử lý, thực hiện đánh giá đồng bộ
-            from .matching_service import MatchingService
+            from .matching_service import get_matching_service
 
-            matching_service = MatchingService()
-            results = []
+            matching_service = get_matching_service()
 
-            for application in applications:
-                # Thực hiện đánh giá độ phù hợp đồng bộ
-                match_result = matching_service.match_job_cv(
-                    str(job_id), application_id=str(application.id)
-                )
-                if match_result:
-                    results.append(match_result)
+            # Đánh giá tất cả application trong một lượt: job chỉ được tải và
+            # encode một lần, kết quả được lưu bằng một câu lệnh upsert
+            results = matching_service.match_job_with_all_applications(str(job_id))
 
             # Lấy kết quả đánh giá
             serializer = JobCVMatchSerializer(results, many=True)
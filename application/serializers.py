@@ -1,3 +1,4 @@
+from django.db import transaction
 from rest_framework import serializers
 from .models import JobApplication, CVAnalysis, InterviewSchedule, TestFileUpload
 from users.serializers import ApplicantProfileSerializer
@@ -6,14 +7,10 @@ from users.choices import ApplicationStatus
 
 # Thêm import này
 try:
-    from AI.cv_processing import process_cv_on_application
+    from AI.tasks import process_cv_task
 except ImportError:
-    # Nếu module chưa được tạo, tạo hàm giả
-    def process_cv_on_application(application):
-        import logging
-
-        logging.warning("AI.cv_processing module not found. CV processing skipped.")
-        return None
+    # Nếu module chưa được tạo, bỏ qua bước xử lý CV
+    process_cv_task = None
 
 
 class JobApplicationSerializer(serializers.ModelSerializer):
@@ -170,13 +167,24 @@ class JobApplicationSerializer(serializers.ModelSerializer):
         # Tạo application
         application = super().create(validated_data)
 
-        # Xử lý CV
+        # Xử lý CV bất đồng bộ để không chặn request; task chỉ được gửi sau khi
+        # transaction commit để worker luôn đọc được application
         try:
-            process_cv_on_application(application)
+            if process_cv_task is not None:
+                application_id = str(application.id)
+                transaction.on_commit(lambda: process_cv_task.delay(application_id))
+            else:
+                import logging
+
+                logging.warning(
+                    "AI.tasks module not found. CV processing skipped."
+                )
         except Exception as e:
             import logging
 
-            logging.error(f"Error processing CV for application {application.id}: {e}")
+            logging.error(
+                f"Error queueing CV processing for application {application.id}: {e}"
+            )
 
         return application
 
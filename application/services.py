@@ -5,7 +5,7 @@ import logging
 # Imports từ AI module
 try:
     from AI.cv_processing import process_cv_on_application
-    from AI.matching_service import MatchingService
+    from AI.matching_service import MatchingService, get_matching_service
 except ImportError:
     # Nếu module chưa được tạo, tạo hàm giả
     def process_cv_on_application(application):
@@ -17,6 +17,9 @@ except ImportError:
             logging.warning("AI.matching_service module not found. Matching skipped.")
             return None
 
+    def get_matching_service():
+        return MatchingService()
+
 
 logger = logging.getLogger(__name__)
 
@@ -35,7 +38,7 @@ def process_job_application(application):
         if cv_data:
             try:
                 # Đánh giá sự phù hợp với công việc
-                matching_service = MatchingService()
+                matching_service = get_matching_service()
                 match_result = matching_service.match_job_cv(
                     job_id=application.job.id, application_id=application.id
                 )
@@ -63,7 +66,7 @@ def evaluate_applications_for_job(job_id):
     Đánh giá lại tất cả đơn ứng tuyển cho một công việc
     """
     try:
-        matching_service = MatchingService()
+        matching_service = get_matching_service()
         results = matching_service.match_job_with_all_applications(job_id)
 
         if results:
@@ -272,8 +272,9 @@ class JobApplicationAnalyzeView(APIView):
         application.status = ApplicationStatus.PROCESSING
         application.save()
 
-        # Gửi task xử lý CV bất đồng bộ
-        process_cv_task.delay(str(application.id))
+        # Gửi task xử lý CV bất đồng bộ; người dùng yêu cầu phân tích lại nên
+        # không dùng lại kết quả cũ
+        process_cv_task.delay(str(application.id), force=True)
 
         return Response(
             {
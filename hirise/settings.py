@@ -271,3 +271,21 @@ CELERY_RESULT_SERIALIZER = "json"
 CELERY_TIMEZONE = TIME_ZONE
 CELERY_TASK_TRACK_STARTED = True
 CELERY_TASK_TIME_LIMIT = 30 * 60
+
+# SBERT
+# "onnx" runs the encoder on ONNX Runtime (CPU), needs sentence-transformers[onnx]
+SBERT_BACKEND = os.getenv("SBERT_BACKEND", "torch")
+# Optional ONNX file inside the model repo, e.g. "onnx/model_O3.onnx"
+SBERT_ONNX_FILE = os.getenv("SBERT_ONNX_FILE")
+# Device for the torch backend, e.g. "cpu" or "cuda:1"; unset picks the GPU
+# when one is available
+SBERT_DEVICE = os.getenv("SBERT_DEVICE")
+# On-disk cache of text embeddings, kept outside the source tree
+EMBEDDING_CACHE_DIR = os.getenv(
+    "EMBEDDING_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "hirise", "embeddings"),
+)
+# Files kept on disk; the least recently used are removed beyond this
+EMBEDDING_CACHE_MAX_FILES = int(os.getenv("EMBEDDING_CACHE_MAX_FILES", "100000"))
+# Threads loading CV embeddings when matching a job against its applications
+MATCHING_WORKERS = int(os.getenv("MATCHING_WORKERS", "4"))
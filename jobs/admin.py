@@ -1,6 +1,7 @@
 from django.contrib import admin
 from jobs.models import *
 from application.services import evaluate_applications_for_job
+from AI.tasks import process_jobs_task
 
 
 class LocationAdmin(admin.ModelAdmin):
@@ -37,7 +38,7 @@ class JobAdmin(admin.ModelAdmin):
     search_fields = ("title", "description", "company__name")
     date_hierarchy = "created_at"
     filter_horizontal = ("locations", "industries", "skills")
-    actions = ["evaluate_applications"]
+    actions = ["evaluate_applications", "reprocess_jobs"]
 
     def evaluate_applications(self, request, queryset):
         total_evaluated = 0
@@ -55,6 +56,14 @@ class JobAdmin(admin.ModelAdmin):
 
     evaluate_applications.short_description = "Evaluate applications for selected jobs"
 
+    def reprocess_jobs(self, request, queryset):
+        # One task for the whole selection, so the jobs are encoded in batches
+        job_ids = [str(job_id) for job_id in queryset.values_list("id", flat=True)]
+        process_jobs_task.delay(job_ids)
+        self.message_user(request, f"Queued AI processing for {len(job_ids)} jobs")
+
+    reprocess_jobs.short_description = "Reprocess AI data for selected jobs"
+
 
 class SavedJobAdmin(admin.ModelAdmin):
     list_display = ("applicant", "job", "created_at")
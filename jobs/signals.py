@@ -35,12 +35,8 @@ def job_post_save(sender, instance, created, **kwargs):
     # Nếu job được cập nhật và có trạng thái PUBLISHED, xử lý lại dữ liệu bất đồng bộ
     if instance.status == JobStatus.PUBLISHED:
         try:
-            # Tìm và xóa dữ liệu cũ nếu có
-            from AI.models import JobProcessedData
-
-            JobProcessedData.objects.filter(job=instance).delete()
-
-            # Gửi task xử lý job bất đồng bộ
+            # Gửi task xử lý job bất đồng bộ; dữ liệu cũ được giữ lại để task
+            # bỏ qua việc encode nếu nội dung job không đổi
             process_job_task.delay(str(instance.id), "update")
             logging.info(f"Job {instance.id} processing task queued")
         except Exception as e: